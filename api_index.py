@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+API 参考索引：从示例中的 /// 和 //! 文档注释提取声明，按章节生成可供网站加载的 JSON
+- /// 注释归属于紧随其后的声明（fn / const / var / 容器字段），//! 注释归属于文件本身
+- 文档注释块中夹杂的普通 // 注释（包括翻译脚本产生的 "// / ..."）作为续行并入文档
+- 每个符号记录名称、类型、是否 pub、所在容器、签名行、英文和中文文档、文件和行号
+- 按文件内容哈希增量构建：未变化的文件直接复用上次的提取结果，只重写内容有变化的章节文件
+
+输出（默认 .cache/api-index/）：
+  <章节>.json   [{"name", "kind", "pub", "parent", "signature", "doc_en", "doc_zh", "file", "line"}...]
+  index.json    {章节: 符号数}
+
+用法：
+  python3 api_index.py [--output DIR] [--sqlite PATH] [--search NAME]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+from comment_cache import DOC, LINE, TOP_DOC, extract_comments
+from run_journal import atomic_write
+
+CODE_DIR = Path("chapters-data/code")
+OUTPUT_DIR = Path(".cache/api-index")
+CACHE_PATH = Path(".cache/api-index.cache.json")
+# 提取规则变化时递增，使旧缓存失效
+CACHE_VERSION = 1
+
+CJK_RE = re.compile(r'[一-鿿]')
+DECL_RE = re.compile(
+    r'^(?P<indent>\s*)(?P<pub>pub\s+)?(?:(?:export|extern(?:\s+"\w+")?|inline|noinline|threadlocal)\s+)*'
+    r'(?P<kind>fn|const|var)\s+(?P<name>@"[^"]+"|\w+)'
+)
+CONTAINER_RE = re.compile(r'=\s*(?:extern\s+|packed\s+)?(struct|enum|union|opaque)\b')
+MANGLED_DOC_RE = re.compile(r'^/\s*')
+FIELD_RE = re.compile(r'^(?P<indent>\s*)(?P<name>\w+)\s*:\s*[^=,]+')
+
+
+def split_doc(lines):
+    """把文档注释行按是否含中文分成 (英文, 中文)"""
+    en = [line for line in lines if line and not CJK_RE.search(line)]
+    zh = [line for line in lines if CJK_RE.search(line)]
+    return ' '.join(en), ' '.join(zh)
+
+
+def extract_symbols(text, rel):
+    """提取单个文件中带文档注释的声明，返回符号列表"""
+    lines = text.split('\n')
+    records = extract_comments(text)
+    docs = {lineno: body for lineno, _, kind, body in records if kind == DOC}
+    # 文档注释块中混入的普通注释（翻译后常见 "// / ..." 形式）视为同一块的续行
+    plain = {lineno: MANGLED_DOC_RE.sub('', body) for lineno, _, kind, body in records if kind == LINE}
+    top = [body for _, _, kind, body in records if kind == TOP_DOC]
+
+    symbols = []
+    if any(top):
+        en, zh = split_doc(top)
+        symbols.append({
+            "name": Path(rel).stem, "kind": "module", "pub": True, "parent": None,
+            "signature": None, "doc_en": en, "doc_zh": zh, "file": rel, "line": 1,
+        })
+
+    containers = []  # [(缩进长度, 名称)]
+    pending = []
+    for lineno, line in enumerate(lines, 1):
+        if lineno in docs:
+            pending.append(docs[lineno])
+            continue
+        if pending and lineno in plain:
+            pending.append(plain[lineno])
+            continue
+        if not line.strip():
+            continue
+
+        decl = DECL_RE.match(line)
+        match = decl or FIELD_RE.match(line)
+        indent = len(match.group('indent')) if match else len(line) - len(line.lstrip())
+        while containers and containers[-1][0] >= indent:
+            containers.pop()
+
+        if decl:
+            kind = decl.group('kind')
+            container = CONTAINER_RE.search(line)
+            if container and kind == 'const':
+                kind = container.group(1)
+            name = decl.group('name')
+        elif match and containers:
+            kind, name = "field", match.group('name')
+        else:
+            pending = []
+            continue
+
+        if pending:
+            en, zh = split_doc(pending)
+            symbols.append({
+                "name": name, "kind": kind, "pub": bool(decl and decl.group('pub')),
+                "parent": containers[-1][1] if containers else None,
+                "signature": line.strip().rstrip('{').rstrip(),
+                "doc_en": en, "doc_zh": zh, "file": rel, "line": lineno,
+            })
+            pending = []
+
+        if kind in ("struct", "enum", "union", "opaque"):
+            containers.append((indent, name))
+
+    return symbols
+
+
+def load_cache(path):
+    """读取增量缓存 {路径: {"sha256", "symbols"}}；版本不符时视为空"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def build_index(code_dir, cache):
+    """按文件哈希增量提取所有文件，返回 ({路径: 缓存项}, 重新提取的文件数)"""
+    files = {}
+    parsed = 0
+    for path in sorted(code_dir.rglob("*.zig")):
+        rel = path.relative_to(code_dir).as_posix()
+        with open(path, 'rb') as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        entry = cache.get(rel)
+        if not entry or entry["sha256"] != digest:
+            entry = {"sha256": digest, "symbols": extract_symbols(data.decode('utf-8', errors='replace'), rel)}
+            parsed += 1
+        files[rel] = entry
+    return files, parsed
+
+
+def write_if_changed(path, text):
+    """内容变化时才写入，返回是否写入"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    atomic_write(path, text)
+    return True
+
+
+def write_chapters(output_dir, files):
+    """按章节写出紧凑 JSON，返回 ({章节: 符号数}, 写入的文件数)"""
+    chapters = {}
+    for rel, entry in files.items():
+        chapters.setdefault(rel.split('/', 1)[0], []).extend(entry["symbols"])
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for chapter, symbols in sorted(chapters.items()):
+        if symbols:
+            written += write_if_changed(output_dir / f"{chapter}.json",
+                                        json.dumps(symbols, ensure_ascii=False, separators=(',', ':')))
+    for stale in output_dir.glob("*.json"):
+        if stale.stem != "index" and not chapters.get(stale.stem):
+            stale.unlink()
+
+    counts = {chapter: len(symbols) for chapter, symbols in sorted(chapters.items()) if symbols}
+    written += write_if_changed(output_dir / "index.json", json.dumps(counts, ensure_ascii=False, indent=1) + '\n')
+    return counts, written
+
+
+def write_sqlite(path, files):
+    """把全部符号写入 SQLite 的 symbols 表（整表重建）"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        DROP TABLE IF EXISTS symbols;
+        CREATE TABLE symbols (name TEXT, kind TEXT, pub INTEGER, parent TEXT, signature TEXT,
+                              doc_en TEXT, doc_zh TEXT, chapter TEXT, file TEXT, line INTEGER);
+        CREATE INDEX symbols_name ON symbols (name);
+        CREATE INDEX symbols_chapter ON symbols (chapter);
+    """)
+    conn.executemany(
+        "INSERT INTO symbols VALUES (:name, :kind, :pub, :parent, :signature, :doc_en, :doc_zh, :chapter, :file, :line)",
+        ({**s, "chapter": s["file"].split('/', 1)[0]} for entry in files.values() for s in entry["symbols"]),
+    )
+    conn.commit()
+    conn.close()
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="从文档注释生成按章节划分的 API 参考索引")
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR, help="章节 JSON 输出目录")
+    parser.add_argument('--sqlite', type=Path, metavar='PATH', help="同时写出 SQLite 数据库")
+    parser.add_argument('--search', metavar='NAME', help="按名称（不区分大小写的子串）查找符号")
+    args = parser.parse_args()
+
+    if not CODE_DIR.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    files, parsed = build_index(CODE_DIR, load_cache(CACHE_PATH))
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(CACHE_PATH, json.dumps({"version": CACHE_VERSION, "files": files}, ensure_ascii=False))
+    counts, written = write_chapters(args.output, files)
+    if args.sqlite:
+        write_sqlite(args.sqlite, files)
+
+    if args.search:
+        needle = args.search.lower()
+        for entry in files.values():
+            for s in entry["symbols"]:
+                if needle in s["name"].lower():
+                    print(f"{CODE_DIR.as_posix()}/{s['file']}:{s['line']}: {s['kind']} {s['name']}")
+                    if s["signature"]:
+                        print(f"    {s['signature']}")
+                    for doc in (s["doc_en"], s["doc_zh"]):
+                        if doc:
+                            print(f"    {doc[:120]}")
+        return
+
+    print(f"{'='*70}")
+    print(f"总计: {len(files)} 个文件, {sum(counts.values())} 个带文档的符号, {len(counts)} 个章节")
+    print(f"重新提取: {parsed} 个文件, 写入: {written} 个索引文件")
+    print(f"输出目录: {args.output}")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
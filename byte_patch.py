@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+字节区间补丁：用 (偏移, 长度, 替换字节) 描述对原始字节的修改，并一次性拼接到单个输出缓冲区
+- 未修改的字节通过 memoryview 切片原样复制，不经过解码和重新编码
+- 按行遍历时行内容与行尾（\\n 或 \\r\\n）分开，替换只覆盖行内容，行尾和文件末尾的换行保持原样
+- 处理脚本只为有修改的文件生成新内容，没有修改的文件不会被写入
+"""
+
+
+def iter_lines(data):
+    """逐行产出 (行首偏移, 行内容, 行尾)；行内容不含行尾，最后一行没有换行时行尾为 b''"""
+    pos = 0
+    size = len(data)
+    while pos < size:
+        end = data.find(b'\n', pos)
+        if end < 0:
+            yield pos, data[pos:], b''
+            return
+        if end > pos and data[end - 1] == 0x0D:
+            yield pos, data[pos:end - 1], b'\r\n'
+        else:
+            yield pos, data[pos:end], b'\n'
+        pos = end + 1
+
+
+def newline_of(data):
+    """文件使用的换行符：含 \\r\\n 时为 CRLF，否则为 LF"""
+    return b'\r\n' if b'\r\n' in data else b'\n'
+
+
+def apply_edits(data, edits):
+    """按偏移顺序把修改应用到 data，返回新的 bytearray；修改区间不能重叠"""
+    edits = sorted(edits, key=lambda e: e[0])
+    out = bytearray(len(data) + sum(len(new) - length for _, length, new in edits))
+    src = memoryview(data)
+    pos = written = 0
+    for offset, length, new in edits:
+        if offset < pos:
+            raise ValueError(f"overlapping edit at offset {offset}")
+        count = offset - pos
+        out[written:written + count] = src[pos:offset]
+        written += count
+        out[written:written + len(new)] = new
+        written += len(new)
+        pos = offset + length
+    out[written:] = src[pos:]
+    return out
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+交叉引用检查脚本：一次遍历建立全局锚点索引，离线校验所有内部链接
+- DocBook: xml:id 锚点、<link xl:href=...> 跨章引用、linkend 引用（按全局锚点和章节名解析）
+- AsciiDoc: [[id]] 锚点、xref:/<<id>> 引用、include:: 代码路径
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+
+PAGE_DIRS = ["pages", "pages-zh", "pageszhkb"]
+SOURCE_DIR = Path("chapters-data/code")
+
+# 锚点定义
+XML_ID_RE = re.compile(r'xml:id="([^"]+)"')
+ADOC_ANCHOR_RE = re.compile(r'\[\[([^\],]+)(?:,[^\]]*)?\]\]|^\[#([^\].,]+)|anchor:([^\[]+)\[')
+
+# 引用
+XML_HREF_RE = re.compile(r'xl:href="([^"]*)"')
+XML_LINKEND_RE = re.compile(r'linkend="([^"]+)"')
+ADOC_XREF_RE = re.compile(r'xref:([^\[\s]+)\[')
+ADOC_SHORT_XREF_RE = re.compile(r'<<([^,>]+)(?:,[^>]*)?>>')
+ADOC_INCLUDE_RE = re.compile(r'^include::([^\[]+)\[')
+ADOC_LINK_RE = re.compile(r'(?<![\w:])link:([^\[\s]+)\[')
+
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'ftp://', '//')
+
+
+def scan_file(filepath):
+    """逐行扫描单个文件，返回 (锚点集合, 引用列表)"""
+    anchors = set()
+    refs = []
+    is_xml = filepath.suffix == '.xml'
+
+    with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+        for lineno, line in enumerate(f, 1):
+            if is_xml:
+                if 'xml:id' in line:
+                    anchors.update(XML_ID_RE.findall(line))
+                if 'xl:href' in line:
+                    for target in XML_HREF_RE.findall(line):
+                        refs.append((lineno, 'href', target))
+                if 'linkend' in line:
+                    for target in XML_LINKEND_RE.findall(line):
+                        refs.append((lineno, 'linkend', target))
+                continue
+
+            if '[' in line or 'anchor:' in line:
+                for groups in ADOC_ANCHOR_RE.findall(line):
+                    anchors.update(g for g in groups if g)
+            if line.startswith('include::'):
+                m = ADOC_INCLUDE_RE.match(line)
+                if m:
+                    refs.append((lineno, 'include', m.group(1)))
+            if 'xref:' in line:
+                for target in ADOC_XREF_RE.findall(line):
+                    refs.append((lineno, 'xref', target))
+            if '<<' in line:
+                for target in ADOC_SHORT_XREF_RE.findall(line):
+                    refs.append((lineno, 'xref', '#' + target.strip()))
+            if 'link:' in line:
+                for target in ADOC_LINK_RE.findall(line):
+                    refs.append((lineno, 'link', target))
+
+    return anchors, refs
+
+
+def build_index(root):
+    """遍历所有页面目录，返回 (文件锚点索引, 每个文件的引用)"""
+    index = {}
+    file_refs = {}
+    for dirname in PAGE_DIRS:
+        page_dir = root / dirname
+        if not page_dir.exists():
+            continue
+        for filepath in sorted(page_dir.iterdir()):
+            if filepath.suffix not in ('.xml', '.adoc'):
+                continue
+            rel = filepath.relative_to(root)
+            anchors, refs = scan_file(filepath)
+            index[rel] = anchors
+            file_refs[rel] = refs
+
+    # AsciiDoc 自动生成的节 id（如 _entry_point_selection）只出现在对应的 XML 中
+    for rel, anchors in index.items():
+        if rel.suffix == '.adoc':
+            anchors |= index.get(rel.with_suffix('.xml'), set())
+
+    return index, file_refs
+
+
+def linkend_targets(index):
+    """linkend 可指向的全部目标：所有文件的锚点，以及章节文件名（不含扩展名）"""
+    targets = set().union(*index.values())
+    targets.update(rel.stem for rel in index)
+    return targets
+
+
+def resolve(root, index, rel, kind, target, linkends):
+    """解析单个引用，返回错误描述；可解析时返回 None"""
+    if kind == 'include':
+        if target.startswith('{sourcedir}/'):
+            path = root / SOURCE_DIR / target[len('{sourcedir}/'):]
+        else:
+            path = root / rel.parent / target
+        return None if path.exists() else "missing include target"
+
+    if kind == 'linkend':
+        # pageszhkb/ 用 <xref linkend="52__debug-and-valgrind"> 引用其他章节
+        stem = target[:-len(Path(target).suffix)] if Path(target).suffix in ('.adoc', '.xml') else target
+        return None if target in linkends or stem in linkends else "unknown linkend"
+
+    if not target:
+        return "empty link target"
+    if target.startswith(EXTERNAL_PREFIXES) or '{' in target:
+        return None
+
+    path_part, _, anchor = target.partition('#')
+    if path_part:
+        target_rel = rel.parent / path_part
+        if target_rel not in index:
+            if (root / target_rel).exists() or (root / path_part).exists():
+                return None if not anchor else "anchor in non-chapter file"
+            return "missing file"
+    else:
+        target_rel = rel
+
+    if anchor and anchor not in index[target_rel]:
+        return "missing anchor"
+    return None
+
+
+def check(root):
+    """检查全部引用，返回 (已检查数, 问题列表)"""
+    index, file_refs = build_index(root)
+    linkends = linkend_targets(index)
+    problems = []
+    checked = 0
+    for rel, refs in file_refs.items():
+        for lineno, kind, target in refs:
+            checked += 1
+            error = resolve(root, index, rel, kind, target, linkends)
+            if error:
+                problems.append((rel, lineno, kind, target, error))
+    return len(index), checked, problems
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="检查章节中的内部链接、锚点和 include 路径")
+    parser.add_argument('--root', default='.', help="仓库根目录")
+    parser.add_argument('--ignore-empty', action='store_true', help="忽略空的 xl:href")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if not (root / "pages").exists():
+        print("Error: pages directory not found")
+        sys.exit(1)
+
+    files, checked, problems = check(root)
+    if args.ignore_empty:
+        problems = [p for p in problems if p[4] != "empty link target"]
+
+    for rel, lineno, kind, target, error in problems:
+        print(f"{rel}:{lineno}: {error} ({kind}: {target!r})")
+
+    print(f"\n{'='*70}")
+    print(f"总计: {files} 个文件, {checked} 个引用")
+    print(f"无效引用: {len(problems)} 个")
+    print(f"{'='*70}")
+
+    sys.exit(1 if problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+术语一致性检查：在 pages-zh/ 和 pageszhkb/ 的 XML 中查找违反 translation-guidelines.md 的译法
+- 规范中 "英文 → 译法（避免：错误译法、...）" 的条目提供规定译法和已知的错误译法
+- 所有译法编译进同一个 Aho-Corasick 自动机，每个文件只扫描一遍，耗时与术语数量基本无关
+- 标签、属性和 programlisting 内容被屏蔽，只检查正文文本
+- 匹配按最左最长原则选取，错误译法是规定译法的一部分时（如 "堆栈跟踪" 中的 "栈跟踪"）不报告
+- 多进程并行处理所有章节
+
+用法：
+  python3 check_terms.py [--json] [--jobs N]
+"""
+
+import argparse
+import json
+import re
+import sys
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from io_pipeline import parse_positive
+
+GUIDELINES = Path("translation-guidelines.md")
+PAGE_DIRS = ["pages-zh", "pageszhkb"]
+
+GUIDELINE_RE = re.compile(r'^-\s*(.+?)\s*→\s*(.+?)\s*$')
+AVOID_RE = re.compile(r'[（(]\s*避免[：:]\s*(.+?)\s*[）)]')
+NOTE_RE = re.compile(r'[（(].*?[）)]')
+MASK_RE = re.compile(r'<programlisting\b.*?</programlisting>|<!--.*?-->|<[^>]*>', re.DOTALL)
+NON_NEWLINE_RE = re.compile(r'[^\n]')
+
+MASK = '\0'
+
+
+class Automaton:
+    """Aho-Corasick 多模式匹配自动机"""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                state = nxt
+            self.out[state] += (index,)
+
+        # 按层次遍历建立失败链接，并把失败状态的输出合并进来
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] += self.out[self.fail[nxt]]
+
+    def iter(self, text):
+        """产出所有匹配 (起始位置, 模式编号)，包括相互重叠的匹配"""
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield pos - len(patterns[index]) + 1, index
+
+
+def load_terms(path):
+    """解析规范，返回 [(译法, 英文术语, 规定译法或 None)]；规定译法项的第三项为 None"""
+    terms = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            m = GUIDELINE_RE.match(line.strip())
+            if not m:
+                continue
+            english, rendering = m.groups()
+            avoid = AVOID_RE.search(rendering)
+            approved = NOTE_RE.sub('', rendering).strip()
+            if approved:
+                terms.append((approved, english, None))
+            if avoid:
+                for wrong in re.split(r'[、,，]\s*', avoid.group(1)):
+                    if wrong:
+                        terms.append((wrong, english, approved))
+    return terms
+
+
+def leftmost_longest(matches, terms):
+    """从所有重叠匹配中按最左最长原则选出互不重叠的匹配"""
+    chosen = []
+    end = -1
+    for start, index in sorted(matches, key=lambda m: (m[0], -len(terms[m[1]][0]))):
+        if start >= end:
+            chosen.append((start, index))
+            end = start + len(terms[index][0])
+    return chosen
+
+
+def mask_markup(text):
+    """把标签、注释和代码清单替换为占位字符，保留换行以便计算行号"""
+    return MASK_RE.sub(lambda m: NON_NEWLINE_RE.sub(MASK, m.group()), text)
+
+
+_TERMS = None
+_AUTOMATON = None
+
+
+def init_worker(terms):
+    """在工作进程中构建一次自动机"""
+    global _TERMS, _AUTOMATON
+    _TERMS = terms
+    _AUTOMATON = Automaton(t[0] for t in terms)
+
+
+def scan_file(path):
+    """扫描单个文件，返回 (路径, [(行号, 错误译法, 英文术语, 规定译法, 所在行文本)])"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    masked = mask_markup(text)
+    lines = text.split('\n')
+    violations = []
+    line_starts = None
+    for start, index in leftmost_longest(_AUTOMATON.iter(masked), _TERMS):
+        wrong, english, approved = _TERMS[index]
+        if approved is None:
+            continue
+        if line_starts is None:
+            line_starts = [0] + [m.end() for m in re.finditer('\n', text)]
+        lineno = bisect_right(line_starts, start)
+        violations.append((lineno, wrong, english, approved, lines[lineno - 1].strip()))
+    return path, violations
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="检查中文章节的术语是否符合翻译规范")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument('--json', action='store_true', help="以 JSON 输出")
+    args = parser.parse_args()
+
+    if not GUIDELINES.exists():
+        print("Error: translation-guidelines.md not found")
+        sys.exit(1)
+
+    terms = load_terms(GUIDELINES)
+    files = [p for d in PAGE_DIRS for p in sorted(Path(d).glob("*.xml"))]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker, initargs=(terms,)) as pool:
+        for path, violations in pool.map(scan_file, files, chunksize=4):
+            for violation in violations:
+                results.append((path, *violation))
+
+    if args.json:
+        json.dump([{
+            "file": path.as_posix(), "line": lineno, "found": wrong, "term": english, "expected": approved,
+        } for path, lineno, wrong, english, approved, _ in results], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        sys.exit(1 if results else 0)
+
+    for path, lineno, wrong, english, approved, context in results:
+        print(f"{path.as_posix()}:{lineno}: '{wrong}' 应为 '{approved}' ({english})")
+        print(f"    {context[:120]}")
+
+    counts = Counter((wrong, approved) for _, _, wrong, _, approved, _ in results)
+    print(f"\n{'='*70}")
+    print(f"总计: {len(files)} 个文件, {len(terms)} 个译法模式")
+    print(f"违反规范: {len(results)} 处, 涉及 {len({r[0] for r in results})} 个文件")
+    for (wrong, approved), count in counts.most_common():
+        print(f"  {wrong} → {approved}: {count}")
+    print(f"{'='*70}")
+    sys.exit(1 if results else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+注释缓存：按内容哈希缓存每个 .zig 文件中提取出的注释记录
+- 记录：(行号, 前缀, 注释类型, 文本)，前缀为缩进或行内注释前的代码
+- 二进制格式：定长记录表 + UTF-8 字符串区，加载时直接按偏移切片，无需解析
+- 索引按 (mtime, size) 记住每个文件的内容哈希，未变化的文件不必重新读取
+
+格式（小端）：
+  头部    b'ZCC1' + u32 记录数
+  记录表  每条 u32 行号, u32 前缀偏移, u32 前缀长度, u32 文本偏移, u32 文本长度, u8 类型, 3 字节填充
+  字符串区 所有前缀和文本的 UTF-8 字节
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+from pathlib import Path
+
+from run_journal import atomic_write
+
+CACHE_DIR = Path(".cache/comments")
+
+MAGIC = b'ZCC1'
+HEADER = struct.Struct('<4sI')
+RECORD = struct.Struct('<IIIIIB3x')
+
+# 注释类型
+LINE, DOC, TOP_DOC, TRAILING = range(4)
+KIND_NAMES = {LINE: "//", DOC: "///", TOP_DOC: "//!", TRAILING: "trailing"}
+
+
+def find_comment(line):
+    """返回行中注释标记 // 的位置（跳过字符串和字符字面量），没有时返回 -1"""
+    stripped = line.lstrip()
+    # Zig 多行字符串字面量以 \\ 开头，整行都是字符串内容
+    if stripped.startswith('\\\\'):
+        return -1
+
+    quote = None
+    i = 0
+    n = len(line)
+    while i < n:
+        ch = line[i]
+        if quote:
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in ('"', "'"):
+            quote = ch
+        elif ch == '/' and i + 1 < n and line[i + 1] == '/':
+            return i
+        i += 1
+    return -1
+
+
+def extract_comments(content):
+    """提取文件中的所有注释，返回 [(行号, 前缀, 类型, 文本)]"""
+    records = []
+    for lineno, line in enumerate(content.split('\n'), 1):
+        if '//' not in line:
+            continue
+        pos = find_comment(line.rstrip('\r'))
+        if pos < 0:
+            continue
+
+        prefix = line[:pos]
+        body = line[pos + 2:].rstrip('\r')
+        if prefix.strip():
+            kind = TRAILING
+        elif body.startswith('/') and not body.startswith('//'):
+            kind, body = DOC, body[1:]
+        elif body.startswith('!'):
+            kind, body = TOP_DOC, body[1:]
+        else:
+            kind = LINE
+        records.append((lineno, prefix, kind, body.strip()))
+    return records
+
+
+def encode_records(records):
+    """把注释记录编码为紧凑的二进制块"""
+    table = bytearray(HEADER.pack(MAGIC, len(records)))
+    blob = bytearray()
+    for lineno, prefix, kind, text in records:
+        prefix_bytes = prefix.encode('utf-8')
+        text_bytes = text.encode('utf-8')
+        prefix_off = len(blob)
+        blob += prefix_bytes
+        text_off = len(blob)
+        blob += text_bytes
+        table += RECORD.pack(lineno, prefix_off, len(prefix_bytes), text_off, len(text_bytes), kind)
+    return bytes(table + blob)
+
+
+def decode_records(data):
+    """从二进制块直接切片出注释记录"""
+    magic, count = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a comment cache block")
+    view = memoryview(data)
+    blob_start = HEADER.size + count * RECORD.size
+    if blob_start > len(data):
+        raise ValueError("truncated comment cache block")
+    records = []
+    for lineno, prefix_off, prefix_len, text_off, text_len, kind in RECORD.iter_unpack(view[HEADER.size:blob_start]):
+        base = blob_start
+        # 被截断的块里偏移会越过末尾，切片不会报错，必须显式检查
+        if base + prefix_off + prefix_len > len(data) or base + text_off + text_len > len(data):
+            raise ValueError("truncated comment cache block")
+        prefix = str(view[base + prefix_off:base + prefix_off + prefix_len], 'utf-8')
+        text = str(view[base + text_off:base + text_off + text_len], 'utf-8')
+        records.append((lineno, prefix, kind, text))
+    return records
+
+
+def load_index(cache_dir):
+    """读取 {路径: [mtime_ns, size, sha256]} 索引"""
+    try:
+        with open(cache_dir / "index.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_index(cache_dir, index):
+    """写回索引"""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    atomic_write(cache_dir / "index.json", json.dumps(index, sort_keys=True))
+
+
+def read_blob(blob_path):
+    """读取并解码缓存块；不存在或已损坏时返回 None"""
+    try:
+        with open(blob_path, 'rb') as f:
+            return decode_records(f.read())
+    except (FileNotFoundError, ValueError, struct.error):
+        return None
+
+
+def file_comments(filepath, cache_dir, index):
+    """返回文件的注释记录，优先使用缓存；返回 (记录, 是否命中缓存)"""
+    key = Path(filepath).as_posix()
+    st = os.stat(filepath)
+    entry = index.get(key)
+
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        records = read_blob(cache_dir / entry[2][:2] / f"{entry[2]}.bin")
+        if records is not None:
+            return records, True
+
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    index[key] = [st.st_mtime_ns, st.st_size, digest]
+
+    blob_path = cache_dir / digest[:2] / f"{digest}.bin"
+    records = read_blob(blob_path)
+    if records is not None:
+        return records, True
+
+    # 缓存块缺失或损坏（例如上次运行被中断）时重新提取并覆盖
+    records = extract_comments(raw.decode('utf-8', errors='replace'))
+    blob_path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(blob_path, encode_records(records), encoding=None)
+    return records, False
+
+
+def corpus_comments(code_dir, cache_dir=CACHE_DIR):
+    """遍历语料中所有 .zig 文件，产出 (路径, 注释记录)；结束后更新索引"""
+    index = load_index(cache_dir)
+    before = dict(index)
+    for filepath in sorted(code_dir.rglob("*.zig")):
+        records, _ = file_comments(filepath, cache_dir, index)
+        yield filepath, records
+    if index != before:
+        save_index(cache_dir, index)
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="构建或查看 .zig 注释缓存")
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR, help="缓存目录")
+    parser.add_argument('--dump', type=Path, metavar='FILE', help="打印单个文件的注释记录")
+    args = parser.parse_args()
+
+    code_dir = Path("chapters-data/code")
+    if not code_dir.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    index = load_index(args.cache_dir)
+
+    if args.dump:
+        records, _ = file_comments(args.dump, args.cache_dir, index)
+        save_index(args.cache_dir, index)
+        for lineno, prefix, kind, text in records:
+            print(f"{lineno:5}  {KIND_NAMES[kind]:>8}  {prefix!r:12}  {text}")
+        return
+
+    hits = 0
+    files = 0
+    totals = dict.fromkeys(KIND_NAMES, 0)
+    for filepath in sorted(code_dir.rglob("*.zig")):
+        records, hit = file_comments(filepath, args.cache_dir, index)
+        files += 1
+        hits += hit
+        for record in records:
+            totals[record[2]] += 1
+    save_index(args.cache_dir, index)
+
+    print(f"{'='*70}")
+    print(f"总计: {files} 个文件, 缓存命中 {hits} 个")
+    for kind, count in totals.items():
+        print(f"{KIND_NAMES[kind]:>8} 注释: {count} 条")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
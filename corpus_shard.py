@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+语料分片工具：把 chapters-data/code 下的文件确定性地分配到多个构建节点
+- 按文件大小（而非数量）均衡各分片；大小取自 git 暂存区中的 blob，处理脚本改写文件不会让分片移动
+- 合并各分片的统计摘要（总计/已处理/错误列表）为一份报告
+
+用法：
+  python3 premium_translate.py --shard 1/4 --summary shard-1.json
+  python3 corpus_shard.py merge shard-*.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+def parse_shard(spec):
+    """解析 "i/n" 形式的分片参数（i 从 1 开始），返回 (i, n)"""
+    try:
+        index, count = (int(part) for part in spec.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard spec {spec!r}, expected i/n")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard index out of range: {spec!r}")
+    return index, count
+
+
+def stable_sizes(files):
+    """返回 {文件: 分片权重}，权重为 git 暂存区中对应 blob 的大小
+
+    各分片在同一检出中依次运行时，先运行的分片已经改写了文件；用实时大小会让后续分片的划分移动，
+    导致文件被重复处理或漏掉。暂存区在处理过程中不变，未被跟踪的文件（或不在 git 仓库中时）权重为 1，
+    此时退化为按数量均衡，但划分依然稳定。
+    """
+    sizes = dict.fromkeys(files, 1)
+    try:
+        listing = subprocess.run(["git", "ls-files", "-s", "-z", "--", *{os.path.dirname(str(p)) or '.' for p in files}],
+                                 capture_output=True, check=True).stdout
+        blobs = {}
+        for entry in listing.split(b'\0'):
+            if entry:
+                meta, _, name = entry.partition(b'\t')
+                blobs[os.path.normpath(os.fsdecode(name))] = meta.split()[1]
+        wanted = {p: blobs[os.path.normpath(str(p))] for p in files if os.path.normpath(str(p)) in blobs}
+        if not wanted:
+            return sizes
+        batch = subprocess.run(["git", "cat-file", "--batch-check=%(objectname) %(objectsize)"],
+                               input=b'\n'.join(set(wanted.values())) + b'\n',
+                               capture_output=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return sizes
+
+    blob_sizes = {}
+    for line in batch.splitlines():
+        name, _, size = line.partition(b' ')
+        if size.isdigit():
+            blob_sizes[name] = int(size)
+    for path, blob in wanted.items():
+        sizes[path] = blob_sizes.get(blob, 1)
+    return sizes
+
+
+def shard_files(files, index, count):
+    """按大小贪心均衡分片，返回第 index 片（从 1 开始）的文件，保持路径顺序
+
+    所有节点基于同一提交（暂存区中相同的文件与大小）时分片结果完全一致：先按大小降序、路径升序排列，
+    再依次分给当前总大小最小的分片（相同时取编号最小的）。
+    """
+    files = sorted(files, key=lambda p: p.as_posix())
+    if count == 1:
+        return files
+
+    sizes = stable_sizes(files)
+    sized = sorted(((sizes[p], p) for p in files), key=lambda x: (-x[0], x[1].as_posix()))
+    loads = [0] * count
+    assigned = [[] for _ in range(count)]
+    for size, path in sized:
+        target = min(range(count), key=lambda k: (loads[k], k))
+        loads[target] += size
+        assigned[target].append(path)
+
+    return sorted(assigned[index - 1], key=lambda p: p.as_posix())
+
+
+def add_shard_arguments(parser):
+    """为处理脚本添加 --shard / --summary 参数"""
+    parser.add_argument('--shard', type=parse_shard, default=(1, 1), metavar='i/n',
+                        help="只处理第 i 个分片（共 n 个），按文件大小均衡")
+    parser.add_argument('--summary', metavar='PATH',
+                        help="把本分片的统计摘要写入 JSON 文件，供 merge 合并")
+
+
+def write_summary(path, script, shard, total, processed, errors):
+    """写出单个分片的统计摘要"""
+    summary = {
+        "script": script,
+        "shard": f"{shard[0]}/{shard[1]}",
+        "total": total,
+        "processed": processed,
+        "errors": errors,
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+
+def merge_summaries(paths):
+    """合并多个分片摘要，返回合并后的摘要；分片缺失或重复时报错"""
+    summaries = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            summaries.append(json.load(f))
+    if not summaries:
+        raise ValueError("no summaries to merge")
+
+    scripts = {s["script"] for s in summaries}
+    if len(scripts) != 1:
+        raise ValueError(f"summaries come from different scripts: {sorted(scripts)}")
+
+    count = int(summaries[0]["shard"].split('/')[1])
+    seen = sorted(int(s["shard"].split('/')[0]) for s in summaries)
+    if seen != list(range(1, count + 1)):
+        raise ValueError(f"expected shards 1..{count}, got {seen}")
+
+    return {
+        "script": scripts.pop(),
+        "shards": count,
+        "total": sum(s["total"] for s in summaries),
+        "processed": sum(s["processed"] for s in summaries),
+        "errors": [e for s in summaries for e in s["errors"]],
+    }
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="合并各分片的处理摘要")
+    sub = parser.add_subparsers(dest='command', required=True)
+    merge = sub.add_parser('merge', help="合并分片摘要")
+    merge.add_argument('summaries', nargs='+', type=Path)
+    merge.add_argument('--output', type=Path, help="把合并结果写入 JSON 文件")
+    args = parser.parse_args()
+
+    try:
+        merged = merge_summaries(args.summaries)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    for error in merged["errors"]:
+        print(error)
+
+    print(f"\n{'='*70}")
+    print(f"脚本: {merged['script']} ({merged['shards']} 个分片)")
+    print(f"总计: {merged['total']} 个文件")
+    print(f"已处理: {merged['processed']} 个文件")
+    print(f"错误: {len(merged['errors'])} 个")
+    print(f"{'='*70}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False, indent=2)
+
+    sys.exit(1 if merged["errors"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+预览模式：在内存中计算各脚本的新内容，输出统一格式的补丁而不改写任何文件
+- 处理脚本提供 plan_file(filepath, ...)，返回 [(目标路径, 原内容或 None, 新内容)]，内容为 str 或字节
+- 多进程并行计算，按文件顺序流式写出补丁（可用 git apply 应用）
+- 补丁写到标准输出时，统计信息写到标准错误
+"""
+
+import difflib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from io_pipeline import parse_positive
+
+
+def add_dry_run_arguments(parser):
+    """为处理脚本添加 --dry-run / --patch 参数"""
+    parser.add_argument('--dry-run', action='store_true',
+                        help="不修改任何文件，输出统一格式的补丁")
+    parser.add_argument('--patch', metavar='PATH',
+                        help="与 --dry-run 一起使用，把补丁写入文件而不是标准输出")
+    parser.add_argument('--jobs', type=parse_positive, default=None,
+                        help="--dry-run 时的并行进程数（默认 CPU 数）")
+
+
+def render_diff(target, previous, new_content):
+    """生成单个文件的补丁文本，返回 (补丁, 新增行数, 删除行数)；内容可以是 str 或 UTF-8 字节"""
+    name = target.as_posix()
+    if isinstance(previous, (bytes, bytearray)):
+        previous = previous.decode('utf-8')
+    if isinstance(new_content, (bytes, bytearray)):
+        new_content = new_content.decode('utf-8')
+    diff = difflib.unified_diff(
+        (previous or '').splitlines(keepends=True),
+        new_content.splitlines(keepends=True),
+        fromfile='/dev/null' if previous is None else f"a/{name}",
+        tofile=f"b/{name}",
+    )
+    lines = []
+    added = removed = 0
+    for line in diff:
+        if line.startswith('+') and not line.startswith('+++'):
+            added += 1
+        elif line.startswith('-') and not line.startswith('---'):
+            removed += 1
+        if not line.endswith('\n'):
+            line += '\n\\ No newline at end of file\n'
+        lines.append(line)
+    return ''.join(lines), added, removed
+
+
+def plan_diff(plan_func, filepath, extra):
+    """在工作进程中计算单个文件的补丁，返回 (文件, [(目标, 补丁, 新增, 删除)], 错误)"""
+    try:
+        edits = plan_func(filepath, *extra)
+    except Exception as e:
+        return filepath, [], f"Error reading {filepath}: {e}"
+    return filepath, [(target, *render_diff(target, previous, new)) for target, previous, new in edits], None
+
+
+def run_dry_run(files, plan_func, extra, patch_path=None, jobs=None):
+    """并行预览所有文件，流式写出补丁；返回 (有变化的文件数, 错误列表)"""
+    out = open(patch_path, 'w', encoding='utf-8') if patch_path else sys.stdout
+    report = sys.stdout if patch_path else sys.stderr
+    changed = 0
+    errors = []
+    total_added = total_removed = 0
+
+    try:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            n = len(files)
+            results = pool.map(plan_diff, [plan_func] * n, files, [extra] * n, chunksize=4)
+            for filepath, diffs, error in results:
+                if error:
+                    errors.append(error)
+                    print(error, file=report)
+                    continue
+                if diffs:
+                    changed += 1
+                for target, patch, added, removed in diffs:
+                    out.write(patch)
+                    total_added += added
+                    total_removed += removed
+                    print(f"{target.as_posix()} | +{added} -{removed}", file=report)
+    finally:
+        if patch_path:
+            out.close()
+
+    print(f"\n{'='*70}", file=report)
+    print(f"总计: {len(files)} 个文件", file=report)
+    print(f"将修改: {changed} 个文件 (+{total_added} -{total_removed} 行)", file=report)
+    print(f"{'='*70}", file=report)
+    return changed, errors
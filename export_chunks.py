@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+面向 LLM 检索的分块导出：把 pages/（可选 pages-zh/）按章节结构切成有上限的文本块，写成 JSONL
+- 以 chapter / section 为硬边界，同一小节内按段落累积到 --max-tokens，相邻块重叠约 --overlap 个 token
+- 未解析的 include 指令从 chapters-data/code 读取示例代码，以 ``` 代码块写入
+- 每个块带近似 token 数（非 CJK 字符按 4 个一 token，CJK 字符各算一个）和稳定 ID（语言/章节/锚点/序号）
+- 每章一个 JSONL 文件，index.json 记录每个块的 (文件, 字节偏移, 字节长度)，可 mmap 后随机读取
+- 章节 XML 与其引用的示例代码都没变时跳过该章节，只重写改动过的章节文件
+
+用法：
+  python3 export_chunks.py [--zh] [--max-tokens 800] [--overlap 100] [--output DIR]
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from run_journal import atomic_output, atomic_write
+
+CODE_DIR = Path("chapters-data/code")
+OUTPUT_DIR = Path(".cache/llm-chunks")
+SITE_URL = "https://zigbook.net/chapters"
+LANG_DIRS = {"en": Path("pages"), "zh": Path("pages-zh")}
+# 分块规则变化时递增，使所有章节重新生成
+EXPORT_VERSION = 1
+
+DB = "{http://docbook.org/ns/docbook}"
+XML_ID = "{http://www.w3.org/XML/1998/namespace}id"
+SECTIONS = {f"{DB}chapter", f"{DB}section"}
+CODE = {f"{DB}programlisting", f"{DB}screen", f"{DB}literallayout"}
+LISTS = {f"{DB}itemizedlist", f"{DB}orderedlist"}
+ADMONITIONS = {f"{DB}{name}" for name in ("note", "tip", "important", "warning", "caution")}
+SKIP = {f"{DB}info", f"{DB}title", f"{DB}subtitle", "{http://www.w3.org/2000/svg}svg"}
+
+UNRESOLVED_RE = re.compile(r'^Unresolved directive in \S+ - include::example\$chapters-data/code/([^\[]+)\[')
+CJK_RE = re.compile(r'[一-鿿　-〿＀-￯]')
+
+
+def estimate_tokens(text):
+    """近似 token 数：CJK 字符各一个，其余字符每 4 个一个"""
+    cjk = len(CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def inline_text(elem):
+    """元素的纯文本，空白折叠为单个空格"""
+    return ' '.join(''.join(elem.itertext()).split())
+
+
+def code_block(elem, includes):
+    """代码清单：未解析的 include 从示例目录读取，引用的文件记入 includes"""
+    code = ''.join(elem.itertext())
+    m = UNRESOLVED_RE.match(code)
+    if m:
+        path = CODE_DIR / m.group(1)
+        includes.add(path.as_posix())
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                code = f.read()
+        except OSError:
+            code = f"// missing: {path.as_posix()}"
+    language = elem.get("language", "")
+    return f"```{language}\n{code.rstrip()}\n```"
+
+
+def render_blocks(elem, includes):
+    """把元素的块级子元素（不含嵌套的 chapter/section）渲染为文本段落列表"""
+    blocks = []
+    for child in elem:
+        if child.tag in SECTIONS or child.tag in SKIP:
+            continue
+        if child.tag in CODE:
+            blocks.append(code_block(child, includes))
+        elif child.tag in LISTS:
+            items = []
+            for i, item in enumerate(child.iter(f"{DB}listitem"), 1):
+                marker = f"{i}." if child.tag == f"{DB}orderedlist" else "-"
+                items.append(f"{marker} " + ' '.join(render_blocks(item, includes) or [inline_text(item)]))
+            blocks.append('\n'.join(items))
+        elif child.tag.endswith("table"):
+            blocks.append('\n'.join(' | '.join(inline_text(entry) for entry in row.iter(f"{DB}entry"))
+                                    for row in child.iter(f"{DB}row")))
+        elif child.tag in ADMONITIONS:
+            label = child.tag[len(DB):].upper()
+            blocks.append(f"{label}: " + ' '.join(render_blocks(child, includes)))
+        elif child.tag == f"{DB}formalpara":
+            title = child.find(f"{DB}title")
+            para = child.find(f"{DB}para")
+            inner = render_blocks(child if para is None else para, includes)
+            if title is not None and inner:
+                inner[0] = f"{inline_text(title)}:\n{inner[0]}"
+            blocks.extend(inner)
+        elif any(grand.tag in CODE or grand.tag in LISTS for grand in child):
+            blocks.extend(render_blocks(child, includes))
+        else:
+            text = inline_text(child)
+            if text:
+                blocks.append(text)
+    return blocks
+
+
+def split_oversized(block, max_tokens):
+    """把超过上限的单个段落按行切开"""
+    pieces, current = [], []
+    for line in block.split('\n'):
+        if current and estimate_tokens('\n'.join(current + [line])) > max_tokens:
+            pieces.append('\n'.join(current))
+            current = []
+        current.append(line)
+    if current:
+        pieces.append('\n'.join(current))
+    return pieces
+
+
+def chunk_section(heading, blocks, max_tokens, overlap):
+    """把一个小节的段落累积成块，返回 [文本]；相邻块共享末尾不超过 overlap 个 token 的段落"""
+    header_tokens = estimate_tokens(heading) + 1
+    budget = max(max_tokens - header_tokens, 1)
+    pieces = []
+    for block in blocks:
+        pieces.extend(split_oversized(block, budget) if estimate_tokens(block) > budget else [block])
+
+    chunks, current, size = [], [], 0
+    for piece in pieces:
+        # 段落之间的空行约计一个 token
+        tokens = estimate_tokens(piece) + 1
+        if current and size + tokens > budget:
+            chunks.append(current)
+            # 保留末尾若干段落作为下一块的开头
+            carry, carried = [], 0
+            for prev in reversed(current):
+                t = estimate_tokens(prev) + 1
+                if carried + t > overlap or carried + t + tokens > budget:
+                    break
+                carry.insert(0, prev)
+                carried += t
+            current, size = carry, carried
+        current.append(piece)
+        size += tokens
+    if current:
+        chunks.append(current)
+    return [f"{heading}\n\n" + '\n\n'.join(chunk) for chunk in chunks]
+
+
+def iter_sections(elem, titles, includes):
+    """按文档顺序产出 (锚点, 标题路径, 段落列表)"""
+    for child in elem:
+        if child.tag not in SECTIONS:
+            continue
+        title = child.find(f"{DB}title")
+        path = titles + [inline_text(title) if title is not None else ""]
+        yield child.get(XML_ID, ""), path, render_blocks(child, includes)
+        yield from iter_sections(child, path, includes)
+
+
+def chapter_chunks(path, lang, max_tokens, overlap):
+    """解析一章，返回 (块记录列表, 引用的示例文件集合)"""
+    root = ET.parse(path).getroot()
+    includes = set()
+    title = root.find(f"{DB}info/{DB}title")
+    chapter_title = inline_text(title) if title is not None else path.stem
+
+    records = []
+    for anchor, titles, blocks in iter_sections(root, [chapter_title], includes):
+        if not blocks:
+            continue
+        heading = "# " + " > ".join(t for t in titles if t)
+        for part, text in enumerate(chunk_section(heading, blocks, max_tokens, overlap)):
+            record = {
+                "id": f"{lang}/{path.stem}/{anchor}/{part}",
+                "lang": lang,
+                "chapter": path.stem,
+                "anchor": anchor,
+                "heading": titles[1:],
+                "part": part,
+                "tokens": estimate_tokens(text),
+                "sha1": hashlib.sha1(text.encode('utf-8')).hexdigest(),
+                "text": text,
+            }
+            if lang == "en":
+                record["url"] = f"{SITE_URL}/{path.stem}#{anchor}"
+            records.append(record)
+    return records, includes
+
+
+def source_digest(path, includes, params):
+    """章节 XML、引用的示例文件和分块参数的联合哈希"""
+    h = hashlib.sha256(json.dumps(params).encode('utf-8'))
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    for include in sorted(includes):
+        h.update(include.encode('utf-8'))
+        try:
+            with open(include, 'rb') as f:
+                h.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            h.update(b'\0missing')
+    return h.hexdigest()
+
+
+def write_chapter(target, records):
+    """流式写出一章的 JSONL，返回 [[ID, 字节偏移, 字节长度, token 数]]"""
+    entries = []
+    offset = 0
+    with atomic_output(target, encoding=None) as out:
+        for record in records:
+            line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+            out.file.write(line)
+            entries.append([record["id"], offset, len(line), record["tokens"]])
+            offset += len(line)
+        out.commit = True
+    return entries
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="把章节按结构切块导出为带字节偏移索引的 JSONL")
+    parser.add_argument('--zh', action='store_true', help="同时导出 pages-zh/")
+    parser.add_argument('--max-tokens', type=int, default=800, help="每块的近似 token 上限")
+    parser.add_argument('--overlap', type=int, default=100, help="相邻块重叠的近似 token 数")
+    parser.add_argument('--output', type=Path, default=OUTPUT_DIR, help="输出目录")
+    args = parser.parse_args()
+
+    if not CODE_DIR.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    index_path = args.output / "index.json"
+    try:
+        with open(index_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get("chapters", {})
+    except (OSError, ValueError):
+        previous = {}
+
+    params = [EXPORT_VERSION, args.max_tokens, args.overlap]
+    langs = ["en", "zh"] if args.zh else ["en"]
+    chapters = {}
+    rewritten = 0
+    for lang in langs:
+        (args.output / lang).mkdir(parents=True, exist_ok=True)
+        # index.xml 是目录页，不属于任何章节
+        for path in sorted(LANG_DIRS[lang].glob("[0-9]*.xml")):
+            key = f"{lang}/{path.stem}"
+            rel = f"{key}.jsonl"
+            old = previous.get(key)
+            if old and (args.output / rel).exists() and \
+                    old["source"] == source_digest(path, old["includes"], params):
+                chapters[key] = old
+                continue
+
+            try:
+                records, includes = chapter_chunks(path, lang, args.max_tokens, args.overlap)
+            except ET.ParseError as e:
+                print(f"Error parsing {path}: {e}")
+                continue
+            chapters[key] = {
+                "file": rel,
+                "source": source_digest(path, includes, params),
+                "includes": sorted(includes),
+                "chunks": write_chapter(args.output / rel, records),
+            }
+            rewritten += 1
+
+    for key in set(previous) - set(chapters):
+        stale = args.output / previous[key]["file"]
+        if stale.exists():
+            stale.unlink()
+
+    atomic_write(index_path, json.dumps({"version": EXPORT_VERSION, "params": params, "chapters": chapters},
+                                        ensure_ascii=False, indent=1) + '\n')
+
+    total_chunks = sum(len(c["chunks"]) for c in chapters.values())
+    total_tokens = sum(entry[3] for c in chapters.values() for entry in c["chunks"])
+    print(f"{'='*70}")
+    print(f"总计: {len(chapters)} 个章节, {total_chunks} 个块, 约 {total_tokens} 个 token")
+    print(f"重新生成: {rewritten} 个章节, 复用: {len(chapters) - rewritten} 个章节")
+    print(f"输出目录: {args.output}")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,139 +3,223 @@
 最终清理脚本：彻底移除所有重复和格式问题
 """
 
+import argparse
 import os
 import re
 import sys
+from collections import Counter, deque, namedtuple
 from pathlib import Path
 
+from byte_patch import apply_edits, iter_lines
+from corpus_shard import add_shard_arguments, shard_files, write_summary
+from dry_run import add_dry_run_arguments, run_dry_run
+from io_pipeline import add_pipeline_arguments, run_files, run_one
+from run_journal import add_journal_arguments, atomic_write, default_journal, is_done, load_journal, open_journal, record_done
+
+# 本次运行中出现的读写错误，写入分片摘要
+ERRORS = []
+
+# 本次运行中每条清理规则的命中次数
+RULE_HITS = Counter()
+
+# 每行只计算一次的特征，规则直接读取，不再重复 strip()/count('//')
+LineInfo = namedtuple('LineInfo', ['text', 'stripped', 'comment', 'doc', 'markers'])
+
+# 清理规则：when 为按行特征静态匹配的条件（comment / doc / min_markers），
+# test 在窗口 (当前行, 下一行) 上做动态判断，action 返回替换文本，DROP 表示删除当前行。
+# 规则按顺序尝试，第一条命中的规则生效。
+Rule = namedtuple('Rule', ['name', 'when', 'test', 'action'])
+DROP = None
+
+def keep_first_segment(cur):
+    """/// 英文 // ... 格式：合并多余的斜杠，保留第一段作为英文原文"""
+    parts = re.sub(r'//+\s*', '//', cur.text).split('//', 2)
+    return f"{parts[0]}// {parts[1].strip()}"
+
+def keep_last_segment(cur):
+    """// 英文  // 中文 格式：取最后一个 // 后的内容"""
+    parts = cur.text.split('//')
+    return f"{parts[0]}// {parts[-1].strip()}"
+
+def keep_last_inline_segment(cur):
+    """代码 // 英文 // 中文 格式：保留代码和最后一段注释"""
+    code_part, comment = cur.text.split('//', 1)
+    return f"{code_part}// {comment.strip().split('//')[-1].strip()}"
+
+RULES = [
+    # 处理重复的注释行（///格式，或包含三个以上 // 的单行注释）
+    Rule("repeated-markers", dict(comment=True, min_markers=2),
+         lambda cur, nxt: '///' in cur.text or cur.markers >= 3,
+         keep_first_segment),
+    # 处理普通//注释的重复行：下一行完全相同则删除当前行
+    Rule("duplicate-line", dict(comment=True, doc=False),
+         lambda cur, nxt: nxt is not None and nxt.comment and nxt.stripped == cur.stripped,
+         lambda cur: DROP),
+    # 处理格式：// 英文  // 中文
+    Rule("stacked-comment", dict(comment=True, min_markers=2),
+         lambda cur, nxt: True,
+         keep_last_segment),
+    # 处理行内重复注释：代码 // 英文 // 中文
+    Rule("inline-duplicate", dict(comment=False, min_markers=1),
+         lambda cur, nxt: '//' in cur.text.split('//', 1)[1].strip(),
+         keep_last_inline_segment),
+]
+
+# 规则最多需要查看的连续行数（当前行 + 下一行）
+WINDOW = 2
+
+def line_info(text):
+    """计算一行的特征"""
+    stripped = text.strip()
+    return LineInfo(text, stripped, stripped.startswith('//'), stripped.startswith('///'), text.count('//'))
+
+def dispatch_key(info):
+    """规则分派键；空行返回 None（不参与任何规则）"""
+    if not info.stripped:
+        return None
+    return info.comment, info.doc, min(info.markers, 3)
+
+def compile_rules(rules):
+    """把规则的静态条件展开成 分派键 → 候选规则列表 的查找表"""
+    table = {}
+    for comment in (False, True):
+        for doc in (False, True):
+            for markers in range(4):
+                table[(comment, doc, markers)] = [
+                    rule for rule in rules
+                    if rule.when.get('comment', comment) == comment
+                    and rule.when.get('doc', doc) == doc
+                    and markers >= rule.when.get('min_markers', 0)
+                ]
+    return table
+
+DISPATCH = compile_rules(RULES)
+
+def window_stream(lines):
+    """以 (当前行, 下一行) 窗口流式遍历 iter_lines 的输出
+    产出 ((偏移, 行内容, 行尾, 当前行特征), 下一行特征)；最后一行的下一行为 None"""
+    window = deque(maxlen=WINDOW)
+    for offset, line, eol in lines:
+        window.append((offset, line, eol, line_info(line.decode('utf-8'))))
+        if len(window) == WINDOW:
+            yield window[0], window[1][3]
+    if window:
+        yield window[-1], None
+
+def cleanup_edits(data, hits):
+    """计算清理修改，返回 [(偏移, 长度, 替换字节)]；规则命中计入 hits
+    替换只覆盖行内容，行尾保持原样；删除的行连同行尾一起删除"""
+    edits = []
+    for (offset, line, eol, cur), nxt in window_stream(iter_lines(data)):
+        key = dispatch_key(cur)
+        for rule in DISPATCH[key] if key else ():
+            if rule.test(cur, nxt):
+                hits[rule.name] += 1
+                replacement = rule.action(cur)
+                if replacement is DROP:
+                    edits.append((offset, len(line) + len(eol), b''))
+                else:
+                    replacement = replacement.encode('utf-8')
+                    if replacement != line:
+                        edits.append((offset, len(line), replacement))
+                break
+    return edits
+
+def cleanup_content(content):
+    """清理整个文件内容，返回新内容（无变化时与原内容相同）"""
+    data = content.encode('utf-8')
+    edits = cleanup_edits(data, Counter())
+    return apply_edits(data, edits).decode('utf-8') if edits else content
+
+def read_file(filepath):
+    """读取整个文件的原始字节"""
+    with open(filepath, 'rb') as f:
+        return f.read()
+
+def plan_content(filepath, data, hits=None):
+    """根据已读取的字节计算修改，返回 [(目标路径, 原字节, 新字节)]；规则命中计入 hits"""
+    edits = cleanup_edits(data, Counter() if hits is None else hits)
+    return [(Path(filepath), data, apply_edits(data, edits))] if edits else []
+
+def plan_file(filepath):
+    """计算单个文件需要的修改，返回 [(目标路径, 原字节, 新字节)]，不写任何文件"""
+    return plan_content(filepath, read_file(filepath))
+
+def write_edits(edits):
+    """把修改后的字节原子地写回文件"""
+    for target, _, new_data in edits:
+        atomic_write(target, new_data, encoding=None)
+
 def final_cleanup_file(filepath):
     """最终清理单个文件"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        return False
-
-    cleaned_lines = []
-    modified = False
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        original = line
-
-        # 跳过空行
-        if not line.strip():
-            cleaned_lines.append(line)
-            i += 1
-            continue
-
-        # 处理重复的注释行（///格式）
-        if line.strip().startswith('//') and line.strip().count('//') >= 2:
-            # 检测包含多个//的单行注释
-            if '///' in line or (line.count('//') >= 3):
-                # 清理格式：/// 英文
-                line = re.sub(r'//+\s*', '//', line)
-                # 保留第一段作为英文原文
-                if '//' in line:
-                    parts = line.split('//', 2)
-                    if len(parts) >= 2:
-                        prefix = parts[0]
-                        english = parts[1].strip()
-                        cleaned_lines.append(f"{prefix}// {english}")
-                        i += 1
-                        modified = True
-                        continue
-
-        # 处理普通//注释的重复行
-        if line.strip().startswith('//') and not line.strip().startswith('///'):
-            # 查找下一个完全相同的行
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                current_line = line.strip()
-
-                # 如果下一行是重复的//注释，跳过
-                if next_line and next_line.startswith('//') and current_line == next_line:
-                    i += 1
-                    modified = True
-                    continue
-
-        # 处理包含多个//的单行注释，拆分为两行
-        if line.strip().startswith('//') and line.count('//') >= 3:
-            parts = line.split('//')
-            if len(parts) >= 2:
-                prefix = parts[0]
-                content = parts[-1].strip()  # 最后一个//后的内容作为英文
-                cleaned_lines.append(f"{prefix}// {content}")
-                i += 1
-                modified = True
-                continue
-
-        # 处理格式：// 英文  // 英文  // 中文
-        if line.strip().startswith('//') and '//' in line:
-            parts = line.split('//')
-            if len(parts) >= 3:
-                prefix = parts[0]
-                english = parts[-1].strip()  # 取最后一个//后的内容作为英文
-                cleaned_lines.append(f"{prefix}// {english}")
-                i += 1
-                modified = True
-                continue
-
-        # 处理行内重复注释 // Handle null case
-        if '//' in line and not line.strip().startswith('//'):
-            parts = line.split('//', 1)
-            if len(parts) == 2:
-                code_part = parts[0]
-                comment = parts[1].strip()
-
-                # 如果包含重复格式，清理
-                if '//' in comment:
-                    comment_parts = comment.split('//')
-                    english = comment_parts[-1].strip()
-                    cleaned_lines.append(f"{code_part}// {english}")
-                    i += 1
-                    modified = True
-                    continue
-
-        cleaned_lines.append(line)
-        i += 1
-
-        if line != original:
-            modified = True
-
-    if modified:
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.writelines(cleaned_lines)
-            return True
-        except Exception as e:
-            print(f"Error writing {filepath}: {e}")
-            return False
-
-    return False
+    _, modified, error = run_one(filepath, read_file, lambda f, data: plan_content(f, data, RULE_HITS), write_edits)
+    if error:
+        ERRORS.append(error)
+        print(ERRORS[-1])
+    return modified
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="最终清理 chapters-data/code 下的 Zig 示例注释")
+    add_shard_arguments(parser)
+    add_journal_arguments(parser, __file__)
+    add_dry_run_arguments(parser)
+    add_pipeline_arguments(parser)
+    args = parser.parse_args()
+    args.journal = args.journal or default_journal(__file__, args.shard)
+
     code_dir = Path("chapters-data/code")
     if not code_dir.exists():
         print("Error: chapters-data/code directory not found")
         sys.exit(1)
 
-    zig_files = list(code_dir.rglob("*.zig"))
-    print(f"Found {len(zig_files)} Zig files\n")
+    zig_files = shard_files(code_dir.rglob("*.zig"), *args.shard)
+    if args.dry_run:
+        _, errors = run_dry_run(zig_files, plan_file, (), args.patch, args.jobs)
+        sys.exit(1 if errors else 0)
 
-    cleaned = 0
+    print(f"Found {len(zig_files)} Zig files (shard {args.shard[0]}/{args.shard[1]})\n")
+
+    done = load_journal(args.journal) if args.resume else {}
+    todo = []
+    skipped = 0
     for i, filepath in enumerate(zig_files, 1):
-        if final_cleanup_file(filepath):
-            print(f"[{i:3}/{len(zig_files)}] ✓ Final cleaned: {filepath.relative_to(Path('.'))}")
-            cleaned += 1
+        if is_done(done, filepath):
+            skipped += 1
+        else:
+            todo.append((i, filepath))
+
+    cleaned = 0
+    with open_journal(args.journal, args.resume) as journal:
+        # 每个文件写入完成时立即记录；--pipeline 下写入乱序完成，不能等按序产出结果时再记
+        outcomes = run_files(
+            [filepath for _, filepath in todo],
+            read_file,
+            lambda f, data: plan_content(f, data, RULE_HITS),
+            write_edits,
+            args.pipeline, args.io_threads, args.queue_depth,
+            done=lambda f: record_done(journal, f),
+        )
+        for (i, filepath), (_, changed, error) in zip(todo, outcomes):
+            if error:
+                ERRORS.append(error)
+                print(ERRORS[-1])
+                continue
+            if changed:
+                print(f"[{i:3}/{len(zig_files)}] ✓ Final cleaned: {filepath.relative_to(Path('.'))}")
+                cleaned += 1
 
     print(f"\n{'='*70}")
     print(f"总计: {len(zig_files)} 个文件")
+    if skipped:
+        print(f"已跳过（续跑）: {skipped} 个文件")
     print(f"已最终清理: {cleaned} 个文件")
+    for rule in RULES:
+        print(f"  规则 {rule.name}: 命中 {RULE_HITS[rule.name]} 次")
     print(f"{'='*70}")
 
+    if args.summary:
+        write_summary(args.summary, Path(__file__).name, args.shard, len(zig_files), cleaned, ERRORS)
+
 if __name__ == "__main__":
     main()
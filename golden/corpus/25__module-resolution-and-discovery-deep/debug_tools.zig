@@ -0,0 +1 @@
+pub const banner = "debug tooling wired at comptime";
@@ -0,0 +1,11 @@
+//  A placeholder installation function for test helpers.
+///
+//  This function is typically used in the context of Zig's build system and testing
+//  framework to set up test infrastructure or register test utilities. In this minimal
+//  implementation, it performs no operations but provides an entry point that can be
+//  called during test setup or module initialization.
+///
+/// # Usage
+//  This function is often called from build scripts or test configuration files
+//  to initialize test helper functionality before running tests.
+pub fn install() void {}
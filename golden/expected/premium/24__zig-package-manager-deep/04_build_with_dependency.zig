@@ -0,0 +1,39 @@
+const std = @import("std");
+
+pub fn build(b: *std.Build) void {
+    const target = b.standardTargetOptions(.{});
+    const optimize = b.standardOptimizeOption(.{});
+
+    // 获取 build.zig.zon 中定义的依赖项
+    // 获取 构建.zig.zon 中定义的依赖项
+    const mylib_dep = b.dependency("mylib", .{
+        .target = target,
+        .optimize = optimize,
+    });
+
+    // 从依赖项中获取模块
+    const mylib_module = mylib_dep.module("mylib");
+
+    const exe = b.addExecutable(.{
+        .name = "app",
+        .root_module = b.createModule(.{
+            .root_source_file = b.path("src/main.zig"),
+            .target = target,
+            .optimize = optimize,
+        }),
+    });
+
+    // 导入依赖项模块
+    exe.root_module.addImport("mylib", mylib_module);
+
+    b.installArtifact(exe);
+
+    const run_cmd = b.addRunArtifact(exe);
+    run_cmd.step.dependOn(b.getInstallStep());
+    if (b.args) |args| {
+        run_cmd.addArgs(args);
+    }
+
+    const run_step = b.step("run", "Run the app");
+    run_step.dependOn(&run_cmd.step);
+}
@@ -0,0 +1,3 @@
+pub fn install() []const u8 {
+    return "Diagnostics overlay instrumentation active";
+}
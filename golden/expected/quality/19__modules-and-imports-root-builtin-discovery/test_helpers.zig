@@ -0,0 +1,18 @@
+// A placeholder installation function for test helpers.
+// 一个 placeholder installation 函数 用于 test helpers.
+///
+// This function is typically used in the context of Zig's build system and testing
+// 此 函数 is typically used 在 context 的 Zig's 构建 system 和 testing
+// framework to set up test infrastructure or register test utilities. In this minimal
+// framework 到 set up test infrastructure 或 register test utilities. 在 此 最小化
+// implementation, it performs no operations but provides an entry point that can be
+// implementation, it performs 不 operations but provides 一个 程序入口点 该 can be
+// called during test setup or module initialization.
+// called during test setup 或 module initialization.
+///
+/// # Usage
+// This function is often called from build scripts or test configuration files
+// 此 函数 is often called 从 构建 scripts 或 test configuration 文件
+// to initialize test helper functionality before running tests.
+// 到 initialize test helper functionality before running tests.
+pub fn install() void {}
@@ -0,0 +1,39 @@
+const std = @import("std");
+
+pub fn main() !void {
+    std.debug.print("--- Package Identity Validation ---\n\n", .{});
+
+    // Simulate package metadata inspection
+    const pkg_name = "mylib";
+    const pkg_version = "1.0.0";
+    const fingerprint: u64 = 0xabcdef1234567890;
+
+    std.debug.print("Package: {s}\n", .{pkg_name});
+    std.debug.print("Version: {s}\n", .{pkg_version});
+    std.debug.print("Fingerprint: 0x{x}\n\n", .{fingerprint});
+
+    // Validate semantic version format
+    // 验证 semantic version format
+    const version_valid = validateSemVer(pkg_version);
+    std.debug.print("Version format valid: {}\n", .{version_valid});
+
+    // Check fingerprint uniqueness
+    // 检查 fingerprint uniqueness
+    std.debug.print("\nFingerprint ensures:\n", .{});
+    std.debug.print("  - Globally unique package identity\n", .{});
+    std.debug.print("  - Unambiguous version detection\n", .{});
+    std.debug.print("  - Fork detection (hostile vs. legitimate)\n", .{});
+
+    std.debug.print("\nWARNING: Changing fingerprint of a maintained project\n", .{});
+    std.debug.print("         is considered a hostile fork attempt!\n", .{});
+}
+
+fn validateSemVer(version: []const u8) bool {
+    // Simplified validation: check for X.Y.Z format
+    // Simplified validation: 检查 X.Y.Z format
+    var parts: u8 = 0;
+    for (version) |c| {
+        if (c == '.') parts += 1;
+    }
+    return parts == 2; // Must have exactly 2 dots
+}
@@ -0,0 +1,77 @@
+// ! Reporting module for displaying analytics metrics in various formats.
+// ! Reporting module 用于 displaying analytics metrics 在 various formats.
+// ! 用于以各种格式显示分析指标的报告模块。
+// ! This module provides utilities to render metrics as human-readable text
+// ! 此 module provides utilities 到 render metrics 作为 human-readable text
+// ! 该模块提供将指标渲染为人类可读文本的工具
+// ! or export them in CSV format for further analysis.
+// ! 或 export them 在 CSV format 用于 further analysis.
+// ! 或以 CSV 格式导出它们以进行进一步分析。
+
+const std = @import("std");
+const analytics = @import("analytics");
+
+// / Renders a metric's statistics to a writer in a human-readable format.
+// / Renders 一个 metric's statistics 到 一个 writer 在 一个 human-readable format.
+// / 以人类可读的格式将指标的统计数据渲染到写入器。
+// / Outputs the metric name, number of data points, mean, standard deviation,
+// / Outputs metric name, 数字 的 数据 points, mean, 标准 deviation,
+// / 输出指标名称、数据点数量、平均值、标准差、
+// / and performance profile label.
+// / 和 performance profile 标签.
+// / 和性能配置文件标签。
+///
+/// Parameters:
+// /   - metric: The analytics metric to render
+// / - metric: analytics metric 到 render
+// /   - metric: 要渲染的分析指标
+// / - metric: 要渲染的分析指标
+// /   - writer: Any writer interface that supports the print() method
+// / - writer: Any writer 接口 该 supports 打印() method
+// /   - writer: 支持 print() 方法的任何写入器接口
+// / - writer: 支持 打印() 方法的任何写入器接口
+///
+// / Returns an error if writing to the output fails.
+// / 返回一个 错误 如果 writing 到 输出 fails.
+// / 如果写入输出失败，则返回错误。
+pub fn render(metric: analytics.Metric, writer: anytype) !void {
+    try writer.print("metric: {s}\n", .{metric.name});
+    try writer.print("count: {}\n", .{metric.values.len});
+    try writer.print("mean: {d:.2}\n", .{analytics.mean(metric)});
+    try writer.print("deviation: {d:.2}\n", .{analytics.deviation(metric)});
+    try writer.print("profile: {s}\n", .{analytics.highlight(metric)});
+}
+
+// / Exports a metric's statistics as a CSV-formatted string.
+// / Exports 一个 metric's statistics 作为 一个 CSV-格式化 string.
+// / 将指标的统计数据导出为 CSV 格式的字符串。
+// / Creates a two-row CSV with headers and a single data row containing
+// / Creates 一个 两-row CSV 使用 headers 和 一个 single 数据 row containing
+// / 创建一个包含标题的两行 CSV，以及一个包含
+// / the metric's name, mean, deviation, and highlight label.
+// / metric's name, mean, deviation, 和 highlight 标签.
+// / 指标名称、平均值、偏差和高亮标签的单行数据。
+///
+/// Parameters:
+// /   - metric: The analytics metric to export
+// / - metric: analytics metric 到 export
+// /   - metric: 要导出的分析指标
+// / - metric: 要导出的分析指标
+// /   - allocator: Memory allocator for the resulting string
+// / - allocator: 内存 allocator 用于 resulting string
+// /   - allocator: 用于结果字符串的内存分配器
+// / - allocator: 用于结果字符串的内存分配器
+///
+// / Returns a heap-allocated CSV string, or an error if allocation or formatting fails.
+// / 返回 一个 堆-已分配 CSV string, 或 一个 错误 如果 allocation 或 formatting fails.
+// / 返回一个堆分配的 CSV 字符串，如果分配或格式化失败，则返回错误。
+// / Caller is responsible for freeing the returned memory.
+// / Caller is responsible 用于 freeing returned 内存.
+// / 调用者负责释放返回的内存。
+pub fn csv(metric: analytics.Metric, allocator: std.mem.Allocator) ![]u8 {
+    return std.fmt.allocPrint(
+        allocator,
+        "name,mean,deviation,label\n{s},{d:.3},{d:.3},{s}\n",
+        .{ metric.name, analytics.mean(metric), analytics.deviation(metric), analytics.highlight(metric) },
+    );
+}
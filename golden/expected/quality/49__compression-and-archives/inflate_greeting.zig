@@ -0,0 +1,26 @@
+const std = @import("std");
+
+pub fn main() !void {
+    var stdout_buffer: [4096]u8 = undefined;
+    var stdout_writer = std.fs.File.stdout().writer(&stdout_buffer);
+    const stdout = &stdout_writer.interface;
+
+    const compressed = [_]u8{
+        0x78, 0x9c, 0x0b, 0x2e, 0x29, 0x4a, 0x4d, 0xcc, 0xcd, 0xcc, 0x4b, 0x57, 0x48, 0x49,
+        0x4d, 0xce, 0xcf, 0x2d, 0x28, 0x4a, 0x2d, 0x2e, 0xce, 0xcc, 0xcf, 0x53, 0xc8, 0x4e,
+        0x4d, 0x2d, 0x28, 0x56, 0x28, 0xc9, 0xcf, 0xcf, 0x29, 0x56, 0x00, 0x0a, 0xa6, 0x64,
+        0x26, 0x97, 0x24, 0x26, 0xe5, 0xa4, 0xea, 0x71, 0x01, 0x00, 0xdf, 0xba, 0x12, 0xa6,
+    };
+
+    var source: std.Io.Reader = .fixed(&compressed);
+    var inflater = std.compress.flate.Decompress.init(&source, .zlib, &.{});
+
+    var plain_buf: [128]u8 = undefined;
+    var sink = std.Io.Writer.fixed(&plain_buf);
+
+    const decoded_len = try inflater.reader.streamRemaining(&sink);
+    const decoded = plain_buf[0..decoded_len];
+
+    try stdout.print("decoded ({d} bytes): {s}\n", .{ decoded.len, decoded });
+    try stdout.flush();
+}
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+黄金输出回归检查：在内存中运行翻译/清理流水线，与冻结的期望输出比对
+- 冻结语料：golden/corpus/ 下保存 chapters-data/code 中 .zig 文件的副本
+- 清单：golden/manifest.json 记录每条流水线、每个文件的输出哈希
+- 期望输出：golden/expected/<流水线>/ 下保存完整输出，仅在哈希不一致时用于展示 diff
+- golden/ 随仓库提交，CI 直接检查即可；不要在 CI 中运行 freeze，否则回归会被记录为期望输出
+
+用法：
+  python3 golden_check.py freeze     # 从 chapters-data/code 冻结语料并记录期望输出
+  python3 golden_check.py update     # 修改词典/规则后有意接受新输出
+  python3 golden_check.py            # 检查（默认），不写任何源文件
+"""
+
+import argparse
+import difflib
+import hashlib
+import json
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import final_cleanup
+import premium_translate
+import quality_translate
+from io_pipeline import parse_positive
+
+PIPELINES = {
+    "premium": premium_translate.translate_content,
+    "quality": quality_translate.translate_content,
+    "cleanup": final_cleanup.cleanup_content,
+}
+
+CODE_DIR = Path("chapters-data/code")
+
+
+def digest(text):
+    """返回文本 UTF-8 编码的 sha256"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def run_pipelines(corpus_dir, rel):
+    """在内存中对单个文件运行所有流水线，返回 (相对路径, {流水线: 输出})"""
+    with open(corpus_dir / rel, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return rel, {name: transform(content) for name, transform in PIPELINES.items()}
+
+
+def run_corpus(corpus_dir, jobs):
+    """并行处理冻结语料中的全部文件，返回 {相对路径: {流水线: 输出}}"""
+    rels = sorted(p.relative_to(corpus_dir).as_posix() for p in corpus_dir.rglob("*.zig"))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(run_pipelines, [corpus_dir] * len(rels), rels, chunksize=8)
+        return dict(results)
+
+
+def record(golden_dir, outputs):
+    """写出清单与期望输出"""
+    expected_dir = golden_dir / "expected"
+    if expected_dir.exists():
+        shutil.rmtree(expected_dir)
+
+    manifest = {name: {} for name in PIPELINES}
+    for rel, by_pipeline in outputs.items():
+        for name, text in by_pipeline.items():
+            manifest[name][rel] = digest(text)
+            target = expected_dir / name / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with open(target, 'w', encoding='utf-8', newline='') as f:
+                f.write(text)
+
+    with open(golden_dir / "manifest.json", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def compare(golden_dir, outputs):
+    """按哈希比对输出，返回 [(流水线, 相对路径, 期望输出或 None, 实际输出或 None)]"""
+    with open(golden_dir / "manifest.json", 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    changed = []
+    for name in PIPELINES:
+        expected_hashes = manifest.get(name, {})
+        for rel in sorted(set(expected_hashes) | set(outputs)):
+            actual = outputs[rel][name] if rel in outputs else None
+            if actual is not None and expected_hashes.get(rel) == digest(actual):
+                continue
+            expected = None
+            expected_path = golden_dir / "expected" / name / rel
+            if rel in expected_hashes and expected_path.exists():
+                with open(expected_path, 'r', encoding='utf-8', newline='') as f:
+                    expected = f.read()
+            changed.append((name, rel, expected, actual))
+    return changed
+
+
+def print_diff(name, rel, expected, actual):
+    """打印单个变化文件的完整 diff"""
+    diff = difflib.unified_diff(
+        (expected or '').splitlines(keepends=True),
+        (actual or '').splitlines(keepends=True),
+        fromfile=f"expected/{name}/{rel}",
+        tofile=f"actual/{name}/{rel}",
+    )
+    for line in diff:
+        sys.stdout.write(line if line.endswith('\n') else line + '\n')
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="翻译/清理流水线的黄金输出回归检查")
+    parser.add_argument('command', nargs='?', default='check', choices=['check', 'freeze', 'update'])
+    parser.add_argument('--golden-dir', type=Path, default=Path("golden"), help="黄金数据目录")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument('--no-diff', action='store_true', help="只列出变化的文件，不打印 diff")
+    args = parser.parse_args()
+
+    corpus_dir = args.golden_dir / "corpus"
+
+    if args.command == 'freeze':
+        if not CODE_DIR.exists():
+            print("Error: chapters-data/code directory not found")
+            sys.exit(1)
+        if corpus_dir.exists():
+            shutil.rmtree(corpus_dir)
+        for src in CODE_DIR.rglob("*.zig"):
+            target = corpus_dir / src.relative_to(CODE_DIR)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(src, target)
+
+    if not corpus_dir.exists():
+        print(f"Error: {corpus_dir} not found, run 'golden_check.py freeze' first")
+        sys.exit(1)
+    manifest_path = args.golden_dir / "manifest.json"
+    if args.command == 'check' and not manifest_path.exists():
+        # 语料在而清单不在说明黄金数据不完整；不能靠重新 freeze 补齐，否则会把当前输出当作期望
+        print(f"Error: {manifest_path} is missing, golden data is incomplete (restore it from git)")
+        sys.exit(1)
+
+    outputs = run_corpus(corpus_dir, args.jobs)
+
+    if args.command in ('freeze', 'update'):
+        record(args.golden_dir, outputs)
+        print(f"已记录: {len(outputs)} 个文件 × {len(PIPELINES)} 条流水线 → {args.golden_dir}")
+        return
+
+    changed = compare(args.golden_dir, outputs)
+    for name, rel, expected, actual in changed:
+        if expected is None or actual is None:
+            state = "新增" if expected is None else "缺失"
+            print(f"[{name}] {state}: {rel}")
+        elif args.no_diff:
+            print(f"[{name}] 变化: {rel}")
+        else:
+            print_diff(name, rel, expected, actual)
+
+    print(f"\n{'='*70}")
+    print(f"总计: {len(outputs)} 个文件 × {len(PIPELINES)} 条流水线")
+    print(f"输出变化: {len(changed)} 个")
+    print(f"{'='*70}")
+
+    sys.exit(1 if changed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+代码高亮缓存：用 pygments 在服务端高亮所有代码清单，结果按内容寻址缓存
+- 扫描 pages/、pages-zh/、pageszhkb/ 的 XML 中的 programlisting（含未解析的 include 指令）
+- 缓存键 = sha256(样式, 语言, pygments 版本, 代码内容)，三个语言版本中相同的清单只高亮一次
+- 只为缓存中不存在的清单启动进程池高亮，全书重建时只处理改动过的示例
+- 索引文件记录每个页面按文档顺序的清单缓存键，以及每个示例文件对应的缓存键，供渲染器直接读取
+
+缓存布局（.cache/highlight/）：
+  objects/<键前两位>/<键>.html   高亮后的 HTML（<pre> 内部内容）
+  <样式>.css                     样式表
+  index.json                     {"style", "pages": {页面: [键或 null...]}, "sources": {示例路径: 键}}
+"""
+
+import argparse
+import hashlib
+import html
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from io_pipeline import parse_positive
+from run_journal import atomic_write
+
+try:
+    import pygments
+    from pygments import highlight
+    from pygments.formatters import HtmlFormatter
+    from pygments.lexers import TextLexer, get_lexer_by_name
+    from pygments.util import ClassNotFound
+except ImportError:
+    pygments = None
+
+CODE_DIR = Path("chapters-data/code")
+PAGE_DIRS = ["pages", "pages-zh", "pageszhkb"]
+CACHE_DIR = Path(".cache/highlight")
+DEFAULT_STYLE = "manni"
+
+LISTING_RE = re.compile(r'<programlisting\b([^>]*)>(.*?)</programlisting>', re.DOTALL)
+LANGUAGE_RE = re.compile(r'\blanguage="([^"]*)"')
+TAG_RE = re.compile(r'<[^>]+>')
+UNRESOLVED_RE = re.compile(r'^Unresolved directive in \S+ - include::example\$chapters-data/code/([^\[]+)\[')
+
+
+def listing_key(code, language, style):
+    """计算清单的缓存键"""
+    h = hashlib.sha256()
+    h.update(f"{style}\0{language}\0{pygments.__version__}\0".encode('utf-8'))
+    h.update(code.encode('utf-8'))
+    return h.hexdigest()
+
+
+def object_path(cache_dir, key):
+    """缓存键对应的 HTML 文件路径"""
+    return cache_dir / "objects" / key[:2] / f"{key}.html"
+
+
+def page_listings(page):
+    """产出页面中每个清单的 (语言, 代码, 示例路径或 None)，按文档顺序；示例文件缺失时代码为 None"""
+    with open(page, 'r', encoding='utf-8') as f:
+        text = f.read()
+    for m in LISTING_RE.finditer(text):
+        lang = LANGUAGE_RE.search(m.group(1))
+        language = lang.group(1) if lang else 'text'
+        code = html.unescape(TAG_RE.sub('', m.group(2)))
+        source = None
+        include = UNRESOLVED_RE.match(code)
+        if include:
+            # 与渲染器一致：未解析的 include 直接读取示例文件
+            source = (CODE_DIR / include.group(1)).as_posix()
+            try:
+                with open(source, 'r', encoding='utf-8') as f:
+                    code = f.read()
+            except OSError:
+                code = None
+        yield language, code, source
+
+
+def highlight_listing(code, language, style, path):
+    """在工作进程中高亮一个清单并写入缓存文件"""
+    try:
+        lexer = get_lexer_by_name(language, stripnl=False, ensurenl=False)
+    except ClassNotFound:
+        lexer = TextLexer(stripnl=False, ensurenl=False)
+    out = highlight(code, lexer, HtmlFormatter(style=style, nowrap=True))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, out)
+    return len(out)
+
+
+def prune(cache_dir, keep):
+    """删除索引中不再引用的缓存文件，返回删除数量"""
+    removed = 0
+    for path in (cache_dir / "objects").glob("*/*.html"):
+        if path.stem not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="高亮所有代码清单并按内容寻址缓存")
+    parser.add_argument('--style', default=DEFAULT_STYLE, help="pygments 样式（默认 manni）")
+    parser.add_argument('--cache-dir', type=Path, default=CACHE_DIR, help="缓存目录")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument('--prune', action='store_true', help="删除不再被引用的缓存文件")
+    args = parser.parse_args()
+
+    if pygments is None:
+        print("Error: pygments is not installed (pip install pygments)")
+        sys.exit(1)
+    if not CODE_DIR.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    pages = {}
+    sources = {}
+    pending = {}  # 键 -> (代码, 语言)
+    total = 0
+    for dirname in PAGE_DIRS:
+        for page in sorted(Path(dirname).glob("*.xml")):
+            keys = []
+            for language, code, source in page_listings(page):
+                if code is None:
+                    # 保留占位，使键列表与页面中的清单一一对应
+                    keys.append(None)
+                    continue
+                key = listing_key(code, language, args.style)
+                keys.append(key)
+                if source:
+                    sources[source] = key
+                if key not in pending and not object_path(args.cache_dir, key).exists():
+                    pending[key] = (code, language)
+            pages[page.as_posix()] = keys
+            total += len(keys)
+
+    distinct = {key for keys in pages.values() for key in keys if key}
+    written = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            keys = list(pending)
+            n = len(keys)
+            written = sum(pool.map(
+                highlight_listing,
+                [pending[k][0] for k in keys], [pending[k][1] for k in keys],
+                [args.style] * n, [object_path(args.cache_dir, k) for k in keys],
+                chunksize=8,
+            ))
+
+    args.cache_dir.mkdir(parents=True, exist_ok=True)
+    css_path = args.cache_dir / f"{args.style}.css"
+    if not css_path.exists():
+        atomic_write(css_path, HtmlFormatter(style=args.style).get_style_defs('.highlight'))
+    index = {"style": args.style, "pygments": pygments.__version__, "pages": pages, "sources": sources}
+    atomic_write(args.cache_dir / "index.json", json.dumps(index, ensure_ascii=False, indent=1) + '\n')
+
+    removed = prune(args.cache_dir, distinct) if args.prune else 0
+
+    print(f"{'='*70}")
+    print(f"总计: {len(pages)} 个页面, {total} 个代码清单, {len(distinct)} 个不同清单")
+    print(f"本次高亮: {len(pending)} 个 ({written / 1024:.1f} KiB), 缓存命中: {len(distinct) - len(pending)} 个")
+    if args.prune:
+        print(f"清理: {removed} 个过期缓存文件")
+    print(f"缓存目录: {args.cache_dir}")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+示例代码清单：把 chapters-data/code 下所有文件的元数据建成 SQLite 数据库
+- 每个文件：章节、类型、大小、哈希、行数、注释数、中英文注释数、翻译状态
+- 每个文件被哪些 .adoc 页面 include（pages/、pages-zh/、pageszhkb/）
+- 增量索引：(mtime, size) 未变的文件直接跳过，变化的文件在进程池中并行重新计算
+
+用法：
+  python3 inventory.py                        # 建立/更新索引
+  python3 inventory.py --report untranslated  # 含未翻译注释的章节
+  python3 inventory.py --report largest       # 行数最多的示例
+  python3 inventory.py --query "SELECT kind, COUNT(*) FROM files GROUP BY kind"
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from comment_cache import extract_comments
+from io_pipeline import parse_positive
+
+CODE_DIR = Path("chapters-data/code")
+PAGE_DIRS = ["pages", "pages-zh", "pageszhkb"]
+DB_PATH = Path(".cache/inventory.sqlite")
+
+CJK_RE = re.compile(r'[一-鿿]')
+LATIN_RE = re.compile(r'[A-Za-z]{2,}')
+INCLUDE_RE = re.compile(r'^include::\{sourcedir\}/([^\[]+)\[', re.MULTILINE)
+
+KINDS = {
+    '.zig': 'zig', '.zon': 'zon', '.wasm': 'wasm', '.a': 'archive', '.zip': 'archive',
+    '.pdb': 'debug', '.txt': 'text', '.log': 'text', '.md': 'text',
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    chapter TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    sha256 TEXT NOT NULL,
+    lines INTEGER,
+    comments INTEGER,
+    english_comments INTEGER,
+    chinese_comments INTEGER,
+    bilingual_pairs INTEGER,
+    state TEXT
+);
+CREATE TABLE IF NOT EXISTS includes (
+    path TEXT NOT NULL,
+    page TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    PRIMARY KEY (path, page, line)
+);
+CREATE INDEX IF NOT EXISTS files_chapter ON files (chapter);
+CREATE INDEX IF NOT EXISTS includes_page ON includes (page);
+"""
+
+REPORTS = {
+    "untranslated": """
+        SELECT chapter, COUNT(*) AS files, SUM(english_comments) AS english_comments
+        FROM files WHERE kind = 'zig' AND state IN ('english', 'partial')
+        GROUP BY chapter ORDER BY english_comments DESC""",
+    "largest": """
+        SELECT path, lines, size FROM files WHERE kind = 'zig'
+        ORDER BY lines DESC LIMIT 20""",
+    "kinds": """
+        SELECT kind, COUNT(*) AS files, SUM(size) AS bytes FROM files
+        GROUP BY kind ORDER BY bytes DESC""",
+    "unreferenced": """
+        SELECT f.path FROM files f LEFT JOIN includes i ON i.path = f.path
+        WHERE f.kind = 'zig' AND i.path IS NULL ORDER BY f.path""",
+    "states": """
+        SELECT state, COUNT(*) AS files FROM files WHERE kind = 'zig'
+        GROUP BY state ORDER BY files DESC""",
+}
+
+
+def file_kind(path, raw):
+    """按扩展名判断文件类型；无法识别且开头 8 KiB 内含 NUL 字节的文件记为 binary"""
+    kind = KINDS.get(path.suffix, 'other')
+    if kind == 'other' and b'\0' in raw[:8192]:
+        kind = 'binary'
+    return kind
+
+
+def translation_state(english, chinese, pairs):
+    """根据注释统计判断翻译状态"""
+    if not english and not chinese:
+        return 'none'
+    if not chinese:
+        return 'english'
+    if not english:
+        return 'chinese'
+    return 'bilingual' if pairs >= english else 'partial'
+
+
+def index_file(path, previous_hash):
+    """计算单个文件的元数据；内容哈希与上次相同时只返回哈希和 stat 信息"""
+    st = path.stat()
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+    row = {
+        "path": path.as_posix(),
+        "chapter": path.relative_to(CODE_DIR).parts[0],
+        "kind": file_kind(path, raw),
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "sha256": digest,
+    }
+    if digest == previous_hash:
+        return row, False
+
+    row.update(lines=None, comments=None, english_comments=None,
+               chinese_comments=None, bilingual_pairs=None, state=None)
+    if row["kind"] in ('zig', 'zon'):
+        text = raw.decode('utf-8', errors='replace')
+        records = extract_comments(text)
+        english = chinese = pairs = 0
+        previous = None
+        for record in records:
+            lineno, prefix, _, comment = record
+            if CJK_RE.search(comment):
+                chinese += 1
+                if previous and previous[0] + 1 == lineno and previous[1] == prefix \
+                        and not CJK_RE.search(previous[3]) and LATIN_RE.search(previous[3]):
+                    pairs += 1
+            elif LATIN_RE.search(comment):
+                english += 1
+            previous = record
+        row.update(lines=text.count('\n') + (0 if text.endswith('\n') or not text else 1),
+                   comments=len(records), english_comments=english, chinese_comments=chinese,
+                   bilingual_pairs=pairs, state=translation_state(english, chinese, pairs))
+    return row, True
+
+
+def scan_includes(root):
+    """收集所有 .adoc 页面中的 include::{sourcedir}/... 引用"""
+    rows = []
+    for dirname in PAGE_DIRS:
+        for page in sorted((root / dirname).glob("*.adoc")):
+            with open(page, 'r', encoding='utf-8', errors='replace') as f:
+                text = f.read()
+            for m in INCLUDE_RE.finditer(text):
+                target = (CODE_DIR / m.group(1)).as_posix()
+                rows.append((target, page.as_posix(), text.count('\n', 0, m.start()) + 1))
+    return rows
+
+
+def update_index(conn, jobs):
+    """增量更新索引，返回 (文件总数, 重新计算数, 删除数)"""
+    known = {path: (mtime, size, digest) for path, mtime, size, digest
+             in conn.execute("SELECT path, mtime_ns, size, sha256 FROM files")}
+
+    files = sorted(p for p in CODE_DIR.rglob("*") if p.is_file())
+    stale = []
+    for path in files:
+        entry = known.get(path.as_posix())
+        st = path.stat()
+        if not entry or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            stale.append((path, entry[2] if entry else None))
+
+    recomputed = 0
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = pool.map(index_file, [p for p, _ in stale], [h for _, h in stale], chunksize=8)
+            for row, full in results:
+                if full:
+                    recomputed += 1
+                    conn.execute(
+                        "INSERT OR REPLACE INTO files VALUES (:path, :chapter, :kind, :size, :mtime_ns, :sha256, "
+                        ":lines, :comments, :english_comments, :chinese_comments, :bilingual_pairs, :state)", row)
+                else:
+                    conn.execute("UPDATE files SET mtime_ns = :mtime_ns, size = :size WHERE path = :path", row)
+
+    present = {p.as_posix() for p in files}
+    removed = [path for path in known if path not in present]
+    conn.executemany("DELETE FROM files WHERE path = ?", [(p,) for p in removed])
+
+    conn.execute("DELETE FROM includes")
+    conn.executemany("INSERT OR IGNORE INTO includes VALUES (?, ?, ?)", scan_includes(Path(".")))
+    conn.commit()
+    return len(files), recomputed, len(removed)
+
+
+def print_rows(cursor):
+    """以制表符分隔打印查询结果"""
+    print('\t'.join(d[0] for d in cursor.description))
+    for row in cursor:
+        print('\t'.join('' if v is None else str(v) for v in row))
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="建立并查询示例代码的 SQLite 清单")
+    parser.add_argument('--db', type=Path, default=DB_PATH, help="数据库路径")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument('--report', choices=sorted(REPORTS), help="运行预置查询")
+    parser.add_argument('--query', metavar='SQL', help="运行任意 SQL 查询")
+    parser.add_argument('--no-update', action='store_true', help="查询前不更新索引")
+    args = parser.parse_args()
+
+    if not CODE_DIR.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    args.db.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(args.db)
+    conn.executescript(SCHEMA)
+
+    if not args.no_update:
+        total, recomputed, removed = update_index(conn, args.jobs)
+        if not (args.report or args.query):
+            print(f"{'='*70}")
+            print(f"总计: {total} 个文件")
+            print(f"重新索引: {recomputed} 个, 删除: {removed} 个")
+            print(f"数据库: {args.db}")
+            print(f"{'='*70}")
+
+    try:
+        if args.report:
+            print_rows(conn.execute(REPORTS[args.report]))
+        elif args.query:
+            print_rows(conn.execute(args.query))
+    except sqlite3.Error as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
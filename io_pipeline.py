@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+重叠 I/O 流水线：读取 → 计算 → 写入 三段并行，适用于网络文件系统上的检出
+- 读取线程池预读后续文件，写入线程池在后台落盘，计算阶段在主线程按顺序执行
+- 预读队列和待写队列都有上限，计算跟不上时停止预读，写入跟不上时计算等待
+- 结果按输入顺序产出，与顺序模式完全一致；文件只有在写入完成后才会产出
+- 写入在线程池中乱序完成，done 回调在每个文件写入完成时立即调用（可能在写入线程中），
+  用于记录进度日志；若等到按序产出时才记录，中断后已写入但未记录的文件会在续跑时被重复处理
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def parse_positive(value):
+    """解析正整数参数（线程数、队列上限、进程数）"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer {value!r}") from None
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def add_pipeline_arguments(parser):
+    """为处理脚本添加 --pipeline 相关参数"""
+    parser.add_argument('--pipeline', action='store_true',
+                        help="读取、计算、写入重叠执行（适合网络文件系统）")
+    parser.add_argument('--io-threads', type=parse_positive, default=8, help="--pipeline 时读/写线程数")
+    parser.add_argument('--queue-depth', type=parse_positive, default=32, help="--pipeline 时预读和待写队列上限")
+
+
+def run_one(filepath, load, plan, write, done=None):
+    """顺序执行单个文件的三个阶段，返回 (文件, 是否修改, 错误信息或 None)"""
+    try:
+        edits = plan(filepath, load(filepath))
+    except Exception as e:
+        return filepath, False, f"Error reading {filepath}: {e}"
+    if edits:
+        try:
+            write(edits)
+        except Exception as e:
+            return filepath, False, f"Error writing {filepath}: {e}"
+    if done:
+        done(filepath)
+    return filepath, bool(edits), None
+
+
+def write_then(write, edits, done, filepath):
+    """在写入线程中执行写入，成功后立即调用 done"""
+    write(edits)
+    if done:
+        done(filepath)
+
+
+def finish(entry):
+    """等待一个文件的写入完成，返回 (文件, 是否修改, 错误信息或 None)"""
+    filepath, future, error = entry
+    if error:
+        return filepath, False, error
+    if future is None:
+        return filepath, False, None
+    try:
+        future.result()
+    except Exception as e:
+        return filepath, False, f"Error writing {filepath}: {e}"
+    return filepath, True, None
+
+
+def run_files(files, load, plan, write, pipeline=False, io_threads=8, depth=32, done=None):
+    """对每个文件执行 load(文件) → plan(文件, 内容) → write(修改)，按输入顺序产出结果
+
+    load 和 write 只做 I/O，plan 只做计算且不写文件；plan 返回空列表表示无需修改。
+    done(文件) 在文件处理成功（写入完成或无需修改）后立即调用，--pipeline 时可能在写入线程中并发调用。
+    """
+    if io_threads < 1 or depth < 1:
+        # depth 为 0 时不会预读任何文件，流水线会静默地什么都不做
+        raise ValueError(f"io_threads and depth must be at least 1, got {io_threads} and {depth}")
+    if not pipeline:
+        for filepath in files:
+            yield run_one(filepath, load, plan, write, done)
+        return
+
+    pending = iter(files)
+    reads = deque()   # [(文件, 读取 future)]，长度不超过 depth
+    writes = deque()  # [(文件, 写入 future 或 None, 错误信息)]，长度不超过 depth
+
+    with ThreadPoolExecutor(io_threads, thread_name_prefix='read') as readers, \
+            ThreadPoolExecutor(io_threads, thread_name_prefix='write') as writers:
+
+        def prefetch():
+            while len(reads) < depth:
+                filepath = next(pending, None)
+                if filepath is None:
+                    return
+                reads.append((filepath, readers.submit(load, filepath)))
+
+        prefetch()
+        while reads:
+            filepath, future = reads.popleft()
+            prefetch()
+            try:
+                edits = plan(filepath, future.result())
+            except Exception as e:
+                writes.append((filepath, None, f"Error reading {filepath}: {e}"))
+            else:
+                if edits:
+                    writes.append((filepath, writers.submit(write_then, write, edits, done, filepath), None))
+                else:
+                    if done:
+                        done(filepath)
+                    writes.append((filepath, None, None))
+
+            # 已完成的写入立即产出；队列满时等待最早的写入（背压）
+            while writes and (len(writes) > depth or writes[0][1] is None or writes[0][1].done()):
+                yield finish(writes.popleft())
+
+        while writes:
+            yield finish(writes.popleft())
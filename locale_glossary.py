@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+多语言词典：按需加载 glossaries/<语言>.json 并编译为词边界模式
+- zh 使用各翻译脚本内置的 TRANS 词典，原地写回源文件
+- 其他语言的词典只在该语言被请求时读取和编译
+- 非 zh 语言的输出写入 chapters-data/code-<语言>/ 下的镜像目录
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+
+GLOSSARY_DIR = Path(__file__).resolve().parent / "glossaries"
+DEFAULT_LANG = "zh"
+
+
+def available_locales():
+    """返回可用的目标语言（zh 加上 glossaries/ 下的词典文件）"""
+    return [DEFAULT_LANG] + sorted(p.stem for p in GLOSSARY_DIR.glob("*.json"))
+
+
+def load_glossary(lang):
+    """读取某个语言的词典文件"""
+    with open(GLOSSARY_DIR / f"{lang}.json", 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compile_glossary(glossary):
+    """编译为按短语长度降序排列的 (模式, 译文) 列表"""
+    items = sorted(glossary.items(), key=lambda x: len(x[0]), reverse=True)
+    return [
+        (re.compile(r'\b' + re.escape(en_phrase) + r'\b', re.IGNORECASE), translated)
+        for en_phrase, translated in items
+    ]
+
+
+def parse_langs(spec):
+    """解析逗号分隔的目标语言列表，保持顺序并去重"""
+    langs = []
+    known = available_locales()
+    for lang in (part.strip() for part in spec.split(',')):
+        if lang not in known:
+            raise argparse.ArgumentTypeError(f"unknown target language {lang!r}, available: {', '.join(known)}")
+        if lang not in langs:
+            langs.append(lang)
+    return tuple(langs)
+
+
+def add_lang_arguments(parser):
+    """为翻译脚本添加 --target-lang 参数"""
+    parser.add_argument('--target-lang', type=parse_langs, default=(DEFAULT_LANG,), metavar='LANG[,LANG...]',
+                        help=f"目标语言，可用: {', '.join(available_locales())}")
+
+
+def variant_path(filepath, code_dir, lang):
+    """非 zh 语言的输出路径：chapters-data/code-<语言>/ 下的同名文件"""
+    return code_dir.with_name(f"{code_dir.name}-{lang}") / Path(filepath).relative_to(code_dir)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+术语挖掘脚本：从示例代码注释（可选章节正文）中统计高频英文短语，找出词典缺口
+- 单次流式遍历，统计 1–4 元词组
+- 计数表有容量上限，超出时淘汰低频条目，内存占用有界
+- 按频次和"当前词典未覆盖的程度"排序候选术语
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from comment_cache import corpus_comments
+import premium_translate
+import quality_translate
+
+GLOSSARIES = {
+    "premium": premium_translate.TRANS,
+    "quality": quality_translate.TRANS,
+}
+
+WORD_RE = re.compile(r"[A-Za-z][A-Za-z0-9_'-]*")
+CJK_RE = re.compile(r'[一-鿿]')
+TAG_RE = re.compile(r'<[^>]+>')
+PROSE_RE = re.compile(r'<(?:simpara|para|title)>(.*?)</(?:simpara|para|title)>')
+LISTING_RE = re.compile(r'<programlisting\b.*?</programlisting>', re.DOTALL)
+
+# 不单独作为候选的虚词，也不允许出现在多元词组的首尾
+STOP_WORDS = {
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "at", "for", "by", "with",
+    "from", "as", "is", "are", "be", "it", "its", "this", "that", "we", "so", "if",
+    "then", "but", "not", "no", "can", "into", "each", "all", "any", "was", "will",
+}
+
+
+class BoundedCounter(Counter):
+    """有容量上限的计数器：超过上限时只保留计数最高的一半（近似计数，头部准确）"""
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.capacity = capacity
+        self.pruned = 0
+
+    def add(self, key):
+        self[key] += 1
+        if len(self) > self.capacity:
+            keep = self.most_common(self.capacity // 2)
+            self.pruned += len(self) - len(keep)
+            self.clear()
+            self.update(dict(keep))
+
+
+def iter_comments(code_dir):
+    """流式产出所有 .zig 文件中的英文注释文本（经由注释缓存）"""
+    for _, records in corpus_comments(code_dir):
+        for _, _, _, comment in records:
+            if comment and not CJK_RE.search(comment):
+                yield comment
+
+
+def iter_prose(pages_dir):
+    """流式产出 pages/ 中 DocBook 段落和标题的纯文本（跳过代码清单）"""
+    for filepath in sorted(pages_dir.glob("*.xml")):
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            text = LISTING_RE.sub('', f.read())
+        for m in PROSE_RE.finditer(text):
+            yield html.unescape(TAG_RE.sub('', m.group(1)))
+
+
+def count_ngrams(texts, max_n, capacity):
+    """统计 1..max_n 元词组（小写），返回 (计数器, 处理的文本数)"""
+    counts = BoundedCounter(capacity)
+    seen = 0
+    for text in texts:
+        seen += 1
+        words = [w.lower() for w in WORD_RE.findall(text)]
+        for n in range(1, max_n + 1):
+            for i in range(len(words) - n + 1):
+                gram = words[i:i + n]
+                if gram[0] in STOP_WORDS or gram[-1] in STOP_WORDS:
+                    continue
+                counts.add(' '.join(gram))
+    return counts, seen
+
+
+def untranslated_ratio(term, glossary_keys):
+    """词组中未被词典覆盖的单词比例；优先匹配整条短语"""
+    if term in glossary_keys:
+        return 0.0
+    words = term.split()
+    remaining = len(words)
+    i = 0
+    while i < len(words):
+        # 最长匹配：从当前位置起尝试最长的词典短语
+        for j in range(len(words), i, -1):
+            if ' '.join(words[i:j]) in glossary_keys:
+                remaining -= j - i
+                i = j
+                break
+        else:
+            i += 1
+    return remaining / len(words)
+
+
+def rank_terms(counts, glossary, min_count, limit):
+    """按 频次 × 未覆盖比例 排序候选术语"""
+    glossary_keys = {k.lower() for k in glossary}
+    ranked = []
+    for term, freq in counts.items():
+        if freq < min_count:
+            continue
+        ratio = untranslated_ratio(term, glossary_keys)
+        if ratio == 0:
+            continue
+        ranked.append((freq * ratio, term, freq, ratio))
+    ranked.sort(key=lambda x: (-x[0], -x[2], x[1]))
+    return ranked[:limit]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="从注释语料中挖掘词典缺失的高频术语")
+    parser.add_argument('--glossary', choices=sorted(GLOSSARIES), default='premium', help="对照的翻译词典")
+    parser.add_argument('--prose', action='store_true', help="同时统计 pages/ 中的英文正文")
+    parser.add_argument('--max-n', type=int, default=4, help="最大词组长度")
+    parser.add_argument('--min-count', type=int, default=3, help="最低出现次数")
+    parser.add_argument('--limit', type=int, default=50, help="输出条数")
+    parser.add_argument('--capacity', type=int, default=200000, help="计数表容量上限")
+    parser.add_argument('--json', action='store_true', help="以 JSON 输出")
+    args = parser.parse_args()
+
+    code_dir = Path("chapters-data/code")
+    if not code_dir.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    texts = iter_comments(code_dir)
+    if args.prose:
+        texts = (t for source in (texts, iter_prose(Path("pages"))) for t in source)
+
+    counts, seen = count_ngrams(texts, args.max_n, args.capacity)
+    ranked = rank_terms(counts, GLOSSARIES[args.glossary], args.min_count, args.limit)
+
+    if args.json:
+        json.dump([{"term": term, "count": freq, "untranslated": round(ratio, 3), "score": round(score, 2)}
+                   for score, term, freq, ratio in ranked], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+
+    print(f"{'score':>8}  {'count':>6}  {'untr.':>5}  term")
+    for score, term, freq, ratio in ranked:
+        print(f"{score:8.1f}  {freq:6}  {ratio:5.0%}  {term}")
+
+    print(f"\n{'='*70}")
+    print(f"总计: {seen} 条文本, {len(counts)} 个词组")
+    if counts.pruned:
+        print(f"已淘汰低频词组: {counts.pruned} 个（计数为近似值）")
+    print(f"候选术语: {len(ranked)} 个")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
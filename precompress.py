@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+发布内容预压缩：为 pages/、pages-zh/、pageszhkb/ 下的 XML 和 llms.txt 生成压缩副本
+- 每个文件生成同目录的 .gz（安装了 zstandard 时可选 .zst）
+- 进程池并行压缩
+- 清单记录源文件哈希，源文件未变且压缩文件仍在时跳过
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from io_pipeline import parse_positive
+from run_journal import atomic_write
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+PUBLISHED = [("pages", "*.xml"), ("pages-zh", "*.xml"), ("pageszhkb", "*.xml"), (".", "llms.txt")]
+MANIFEST = Path(".precompress-manifest.json")
+
+
+def published_files(root):
+    """列出所有需要预压缩的发布文件"""
+    files = []
+    for dirname, pattern in PUBLISHED:
+        files.extend(sorted((root / dirname).glob(pattern)))
+    return files
+
+
+def compress_file(path, formats, level):
+    """压缩单个文件，返回 (路径, 源哈希, 源大小, {格式: 压缩后大小})"""
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    sizes = {}
+    for fmt in formats:
+        if fmt == 'gz':
+            # mtime=0 让输出只取决于内容，便于缓存和比对
+            out = gzip.compress(data, compresslevel=level, mtime=0)
+        else:
+            out = zstandard.ZstdCompressor(level=19 if level == 9 else level).compress(data)
+        atomic_write(path.with_name(f"{path.name}.{fmt}"), out, encoding=None)
+        sizes[fmt] = len(out)
+
+    return path.as_posix(), hashlib.sha256(data).hexdigest(), len(data), sizes
+
+
+def is_fresh(path, entry, formats):
+    """清单中的哈希与当前源文件一致且所有压缩文件都存在"""
+    if not entry or set(formats) - set(entry["sizes"]):
+        return False
+    if not all(path.with_name(f"{path.name}.{fmt}").exists() for fmt in formats):
+        return False
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest() == entry["sha256"]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="并行预压缩发布的章节 XML 和 llms.txt")
+    parser.add_argument('--zstd', action='store_true', help="同时生成 .zst（需要 zstandard 包）")
+    parser.add_argument('--level', type=int, default=9, help="压缩级别")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument('--force', action='store_true', help="忽略清单，全部重新压缩")
+    args = parser.parse_args()
+
+    formats = ['gz']
+    if args.zstd:
+        if zstandard is None:
+            print("Error: --zstd requires the zstandard package")
+            sys.exit(1)
+        formats.append('zst')
+
+    root = Path(".")
+    if not (root / "pages").exists():
+        print("Error: pages directory not found")
+        sys.exit(1)
+
+    try:
+        with open(MANIFEST, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, ValueError):
+        manifest = {}
+
+    files = published_files(root)
+    stale = [p for p in files if args.force or not is_fresh(p, manifest.get(p.as_posix()), formats)]
+    print(f"Found {len(files)} published files, {len(stale)} to compress\n")
+
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for key, digest, size, sizes in pool.map(compress_file, stale, [formats] * len(stale), [args.level] * len(stale)):
+            manifest[key] = {"sha256": digest, "size": size, "sizes": sizes}
+            ratios = ", ".join(f"{fmt} {out / size:.1%}" if size else f"{fmt} -" for fmt, out in sizes.items())
+            print(f"✓ {key}: {size} bytes → {ratios}")
+
+    # 已删除的源文件不再保留在清单中
+    present = {p.as_posix() for p in files}
+    manifest = {k: v for k, v in manifest.items() if k in present}
+    atomic_write(MANIFEST, json.dumps(manifest, indent=1, sort_keys=True))
+
+    total = sum(e["size"] for e in manifest.values())
+    print(f"\n{'='*70}")
+    print(f"总计: {len(files)} 个文件, {total} 字节")
+    print(f"本次压缩: {len(stale)} 个文件, 跳过: {len(files) - len(stale)} 个文件")
+    for fmt in formats:
+        packed = sum(e["sizes"].get(fmt, 0) for e in manifest.values())
+        if total:
+            print(f"{fmt} 压缩后: {packed} 字节 ({packed / total:.1%})")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,22 @@
 - 雅：用词优雅
 """
 
+import argparse
 import os
 import re
 import sys
 from pathlib import Path
 
+from byte_patch import apply_edits, iter_lines, newline_of
+from corpus_shard import add_shard_arguments, shard_files, write_summary
+from dry_run import add_dry_run_arguments, run_dry_run
+from io_pipeline import add_pipeline_arguments, run_files, run_one
+from locale_glossary import DEFAULT_LANG, add_lang_arguments, compile_glossary, load_glossary, variant_path
+from run_journal import add_journal_arguments, atomic_write, default_journal, is_done, load_journal, open_journal, record_done
+
+# 本次运行中出现的读写错误，写入分片摘要
+ERRORS = []
+
 # 高质量翻译词典 - 英文到专业中文的映射
 TRANS = {
     # 核心概念（保持准确性）
@@ -307,7 +318,18 @@ TRANS = {
     "ziglang": "Zig语言",
 }
 
-def smart_translate(text):
+# 每种语言预编译的 (模式, 译文) 列表，首次使用该语言时构建；词典条目多于 re 模块缓存上限，
+# 逐条 re.sub 会反复重新编译
+_PATTERNS = {}
+
+def compiled_patterns(lang=DEFAULT_LANG):
+    """返回某个语言按短语长度降序排列的预编译词边界模式"""
+    if lang not in _PATTERNS:
+        glossary = TRANS if lang == DEFAULT_LANG else load_glossary(lang)
+        _PATTERNS[lang] = compile_glossary(glossary)
+    return _PATTERNS[lang]
+
+def smart_translate(text, lang=DEFAULT_LANG):
     """智能翻译文本，保持流畅性"""
     if not text.strip():
         return text
@@ -319,13 +341,9 @@ def smart_translate(text):
     # 预处理：清理多余的空白和标点
     text = re.sub(r'\s+', ' ', text.strip())
 
-    # 按短语长度排序，优先匹配长短语
-    items = sorted(TRANS.items(), key=lambda x: len(x[0]), reverse=True)
-
-    for en_phrase, cn_phrase in items:
-        # 使用更精确的正则表达式，确保边界匹配
-        pattern = r'\b' + re.escape(en_phrase) + r'\b'
-        text = re.sub(pattern, cn_phrase, text, flags=re.IGNORECASE)
+    # 按短语长度排序，优先匹配长短语（使用更精确的正则表达式，确保边界匹配）
+    for pattern, cn_phrase in compiled_patterns(lang):
+        text = pattern.sub(cn_phrase, text)
 
     # 后处理：清理多余的空格和标点
     text = re.sub(r'\s+', ' ', text)
@@ -333,97 +351,204 @@ def smart_translate(text):
 
     return text
 
-def translate_line(line):
-    """翻译单行注释"""
+def split_comment(line):
+    """拆出需要翻译的注释，返回 (前缀, 注释)；不需要翻译时返回 None"""
     if '//' not in line:
-        return line
+        return None
 
     # 分离前缀和注释
-    parts = line.split('//', 1)
-    if len(parts) < 2:
-        return line
-
-    prefix = parts[0]
-    comment = parts[1].strip()
+    prefix, comment = line.split('//', 1)
+    comment = comment.strip()
 
     # 跳过空注释
     if not comment:
-        return line
+        return None
 
     # 跳过文件头注释
     if comment.startswith('File:') or comment.startswith('Chapters'):
-        return line
+        return None
 
     # 如果已经是英文在上格式且包含中文，跳过
     if '//' in comment and len(comment.split('//')) > 1:
-        return line
+        return None
+
+    return prefix, comment
+
+def translate_line(line, lang=DEFAULT_LANG, parts=None, newline='\n'):
+    """翻译单行注释；parts 为 split_comment 的结果，已扫描过时可直接传入；newline 为拆成两行时的行尾"""
+    if parts is None:
+        parts = split_comment(line)
+        if parts is None:
+            return line
+
+    prefix, comment = parts
 
     # 翻译注释
-    translated = smart_translate(comment)
+    translated = smart_translate(comment, lang)
 
-    # 如果翻译成功，格式化为英文在上，中文在下
+    # 如果翻译成功，格式化为英文在上，译文在下
     if translated != comment and translated.strip():
         # 第一行英文（原文）
         first_line = f"{prefix}// {comment}"
-        # 第二行中文（翻译）
+        # 第二行译文
         second_line = f"{prefix}// {translated}"
 
-        return f"{first_line}\n{second_line}"
+        return f"{first_line}{newline}{second_line}"
 
     return line
 
-def process_file(filepath):
-    """处理单个文件"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        return False
-
-    lines = content.split('\n')
-    new_lines = []
-    modified = False
-
-    for line in lines:
-        original = line
-        translated_line = translate_line(line)
-        new_lines.append(translated_line)
-
-        if translated_line != original:
-            modified = True
-
-    if modified:
+def comment_edits(data, langs):
+    """只扫描一遍注释，返回 {语言: [(偏移, 长度, 替换字节)]}；替换只覆盖注释行内容，行尾保持原样"""
+    newline = newline_of(data)
+    edits = {lang: [] for lang in langs}
+
+    for offset, line, eol in iter_lines(data):
+        if b'//' not in line:
+            continue
+        text = line.decode('utf-8')
+        parts = split_comment(text)
+        if parts is None:
+            continue
+        sep = (eol or newline).decode('ascii')
+
+        for lang in langs:
+            translated_line = translate_line(text, lang, parts, sep)
+            if translated_line != text:
+                edits[lang].append((offset, len(line), translated_line.encode('utf-8')))
+
+    return edits
+
+def translate_locales(content, langs):
+    """返回 {语言: 新内容}（无变化时与原内容相同）"""
+    data = content.encode('utf-8')
+    return {
+        lang: apply_edits(data, edits).decode('utf-8') if edits else content
+        for lang, edits in comment_edits(data, langs).items()
+    }
+
+def translate_content(content, lang=DEFAULT_LANG):
+    """翻译整个文件内容，返回新内容（无变化时与原内容相同）"""
+    return translate_locales(content, (lang,))[lang]
+
+def load_file(filepath, langs=(DEFAULT_LANG,), code_dir=Path("chapters-data/code")):
+    """读取源文件及各语言已有的镜像文件的原始字节，返回 (源字节, {语言: 原字节或 None})"""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+
+    previous = {}
+    for lang in langs:
+        if lang == DEFAULT_LANG:
+            continue
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(new_lines))
-            return True
-        except Exception as e:
-            print(f"Error writing {filepath}: {e}")
-            return False
-
-    return False
+            with open(variant_path(filepath, code_dir, lang), 'rb') as f:
+                previous[lang] = f.read()
+        except FileNotFoundError:
+            previous[lang] = None
+
+    return data, previous
+
+def plan_loaded(filepath, loaded, langs=(DEFAULT_LANG,), code_dir=Path("chapters-data/code")):
+    """根据已读取的字节计算修改，返回 [(目标路径, 原字节或 None, 新字节)]"""
+    data, previous = loaded
+    edits = []
+    for lang, patches in comment_edits(data, langs).items():
+        if lang == DEFAULT_LANG:
+            # 源文件没有修改时不产生任何写入
+            if patches:
+                edits.append((Path(filepath), data, apply_edits(data, patches)))
+            continue
+
+        target, old = variant_path(filepath, code_dir, lang), previous[lang]
+        new_data = apply_edits(data, patches)
+        if new_data != old:
+            edits.append((target, old, new_data))
+
+    return edits
+
+def plan_file(filepath, langs=(DEFAULT_LANG,), code_dir=Path("chapters-data/code")):
+    """计算单个文件需要的修改，返回 [(目标路径, 原字节或 None, 新字节)]，不写任何文件"""
+    return plan_loaded(filepath, load_file(filepath, langs, code_dir), langs, code_dir)
+
+def write_edits(edits):
+    """把修改后的字节原子地写入各目标文件"""
+    for target, _, new_data in edits:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(target, new_data, encoding=None)
+
+def process_file(filepath, langs=(DEFAULT_LANG,), code_dir=Path("chapters-data/code")):
+    """处理单个文件：zh 译文原地写回，其他语言写入镜像目录"""
+    _, changed, error = run_one(
+        filepath,
+        lambda f: load_file(f, langs, code_dir),
+        lambda f, loaded: plan_loaded(f, loaded, langs, code_dir),
+        write_edits,
+    )
+    if error:
+        ERRORS.append(error)
+        print(ERRORS[-1])
+    return changed
 
 def main():
     """主函数"""
+    parser = argparse.ArgumentParser(description="高质量翻译 chapters-data/code 下的 Zig 示例注释")
+    add_shard_arguments(parser)
+    add_journal_arguments(parser, __file__)
+    add_dry_run_arguments(parser)
+    add_pipeline_arguments(parser)
+    add_lang_arguments(parser)
+    args = parser.parse_args()
+    args.journal = args.journal or default_journal(__file__, args.shard)
+
     code_dir = Path("chapters-data/code")
     if not code_dir.exists():
         print("Error: chapters-data/code directory not found")
         sys.exit(1)
 
-    zig_files = list(code_dir.rglob("*.zig"))
-    print(f"Found {len(zig_files)} Zig files\n")
+    zig_files = shard_files(code_dir.rglob("*.zig"), *args.shard)
+    if args.dry_run:
+        _, errors = run_dry_run(zig_files, plan_file, (args.target_lang, code_dir), args.patch, args.jobs)
+        sys.exit(1 if errors else 0)
 
-    translated = 0
+    print(f"Found {len(zig_files)} Zig files (shard {args.shard[0]}/{args.shard[1]})\n")
+
+    done = load_journal(args.journal) if args.resume else {}
+    todo = []
+    skipped = 0
     for i, filepath in enumerate(zig_files, 1):
-        if process_file(filepath):
-            print(f"[{i:3}/{len(zig_files)}] ✓ 高质量翻译: {filepath.relative_to(Path('.'))}")
-            translated += 1
+        if is_done(done, filepath):
+            skipped += 1
+        else:
+            todo.append((i, filepath))
+
+    translated = 0
+    with open_journal(args.journal, args.resume) as journal:
+        # 每个文件写入完成时立即记录；--pipeline 下写入乱序完成，不能等按序产出结果时再记
+        outcomes = run_files(
+            [filepath for _, filepath in todo],
+            lambda f: load_file(f, args.target_lang, code_dir),
+            lambda f, loaded: plan_loaded(f, loaded, args.target_lang, code_dir),
+            write_edits,
+            args.pipeline, args.io_threads, args.queue_depth,
+            done=lambda f: record_done(journal, f),
+        )
+        for (i, filepath), (_, changed, error) in zip(todo, outcomes):
+            if error:
+                ERRORS.append(error)
+                print(ERRORS[-1])
+                continue
+            if changed:
+                print(f"[{i:3}/{len(zig_files)}] ✓ 高质量翻译: {filepath.relative_to(Path('.'))}")
+                translated += 1
 
     print(f"\n{'='*70}")
     print(f"总计: {len(zig_files)} 个文件")
+    if skipped:
+        print(f"已跳过（续跑）: {skipped} 个文件")
     print(f"已高质量翻译: {translated} 个文件")
     print(f"{'='*70}")
 
+    if args.summary:
+        write_summary(args.summary, Path(__file__).name, args.shard, len(zig_files), translated, ERRORS)
+
 if __name__ == "__main__":
     main()
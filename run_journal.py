@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+断点续跑工具：为长时间的翻译/清理任务提供崩溃安全的写入和进度日志
+- atomic_write / atomic_output: 写入同目录临时文件后 rename，源文件要么是旧内容要么是新内容
+- 追加式日志：每处理完一个文件追加一行，--resume 时跳过已记录且内容未变的文件
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+
+@contextmanager
+def atomic_output(filepath, encoding='utf-8'):
+    """打开同目录临时文件供流式写入；退出时 out.commit 为真才替换目标文件，否则丢弃
+    encoding 为 None 时以二进制模式写入
+
+    用法：
+        with atomic_output(path) as out:
+            out.file.write(...)
+            out.commit = modified
+    """
+    filepath = Path(filepath)
+    fd, tmp_path = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix='.tmp')
+    out = SimpleNamespace(file=None, commit=False)
+    try:
+        f = os.fdopen(fd, 'wb') if encoding is None else os.fdopen(fd, 'w', encoding=encoding, newline='')
+        with f:
+            out.file = f
+            yield out
+            if out.commit:
+                f.flush()
+                os.fsync(f.fileno())
+        if out.commit:
+            if filepath.exists():
+                shutil.copymode(filepath, tmp_path)
+            os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+
+
+def atomic_write(filepath, text, encoding='utf-8'):
+    """原子地替换文件内容，保留原文件权限；encoding 为 None 时 text 为字节"""
+    with atomic_output(filepath, encoding) as out:
+        out.file.write(text)
+        out.commit = True
+
+
+def file_digest(filepath):
+    """返回文件内容的 sha256"""
+    with open(filepath, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def add_journal_arguments(parser, script):
+    """为处理脚本添加 --journal / --resume 参数；默认路径由 default_journal 在解析后确定"""
+    parser.add_argument('--journal', default=None, metavar='PATH',
+                        help=f"进度日志路径（追加写入，默认 .{Path(script).stem}.journal，分片时带分片编号）")
+    parser.add_argument('--resume', action='store_true',
+                        help="跳过日志中已完成且之后未被修改的文件")
+
+
+def default_journal(script, shard):
+    """默认日志路径；每个分片使用自己的日志，同一检出中运行的分片不会清空彼此的记录"""
+    index, count = shard
+    if count == 1:
+        return f".{Path(script).stem}.journal"
+    return f".{Path(script).stem}.shard-{index}-of-{count}.journal"
+
+
+def load_journal(path):
+    """读取日志，返回 {路径: 完成时的内容哈希}；忽略崩溃时写了一半的末行"""
+    done = {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    done[entry["path"]] = entry["sha256"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return done
+
+
+def open_journal(path, resume):
+    """打开日志；非续跑模式下清空旧记录"""
+    journal = open(path, 'a' if resume else 'w', encoding='utf-8')
+    # 崩溃可能留下没有换行的半行，先补齐换行，避免新记录与之粘连
+    if resume and journal.tell() > 0:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                journal.write('\n')
+    return journal
+
+
+_JOURNAL_LOCK = threading.Lock()
+
+
+def record_done(journal, filepath):
+    """记录一个已完成的文件，立即落盘；可在多个写入线程中并发调用"""
+    entry = {"path": Path(filepath).as_posix(), "sha256": file_digest(filepath)}
+    with _JOURNAL_LOCK:
+        journal.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        journal.flush()
+        os.fsync(journal.fileno())
+
+
+def is_done(done, filepath):
+    """文件已记录完成且内容与记录一致"""
+    key = Path(filepath).as_posix()
+    if key not in done:
+        return False
+    try:
+        return file_digest(filepath) == done[key]
+    except OSError:
+        return False
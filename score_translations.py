@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+翻译质量评分：对 chapters-data/code 中所有"英文在上、中文在下"的注释对打分
+- 残留英文比例：中文行中未翻译的英文单词占比（代码标识符和规范中保留英文的术语除外）
+- 术语一致性：英文行出现 translation-guidelines.md 中的术语时，中文行是否使用规定译法
+- 长度比例异常：中英文长度比的对数相对全语料的 z 分数
+- 连续空格：虚词被替换为空字符串后留下的双空格
+
+先收集所有注释对的特征到数组中，再一次性计算统计量和分数。
+"""
+
+import argparse
+import json
+import math
+import re
+import sys
+from array import array
+from collections import defaultdict
+from pathlib import Path
+
+from comment_cache import LINE, corpus_comments
+
+GUIDELINES = Path("translation-guidelines.md")
+
+CJK_RE = re.compile(r'[一-鿿]')
+LATIN_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'-]*")
+TOKEN_RE = re.compile(r"\S+")
+# 像代码的词：含下划线、点、@、括号、数字，或驼峰/全大写
+CODE_LIKE_RE = re.compile(r"[_.@()\[\]{}0-9`:/\\=<>*&|]|^[A-Z0-9]{2,}$|[a-z][A-Z]")
+GUIDELINE_RE = re.compile(r'^-\s*(.+?)\s*→\s*(.+?)\s*$')
+
+
+def load_guidelines(path):
+    """解析规范中的 "英文 → 中文" 条目，返回 (术语规则列表, 允许保留的英文单词集合)"""
+    rules = []
+    keep = {"zig"}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            m = GUIDELINE_RE.match(line.strip())
+            if not m:
+                continue
+            english, chinese = m.groups()
+            chinese = re.sub(r'[（(].*?[）)]', '', chinese).strip()
+            if not chinese:
+                continue
+            if chinese.lower().startswith(english.lower()):
+                keep.update(w.lower() for w in LATIN_WORD_RE.findall(english))
+            pattern = re.compile(r'\b' + re.escape(english) + r'\b', re.IGNORECASE)
+            rules.append((english, chinese, pattern))
+    return rules, keep
+
+
+def bilingual_pairs(code_dir):
+    """产出 (文件, 行号, 英文, 中文)：同一前缀下相邻的英文注释行和中文注释行"""
+    for filepath, records in corpus_comments(code_dir):
+        previous = None
+        for record in records:
+            lineno, prefix, kind, text = record
+            if (previous and kind == LINE and previous[2] == LINE
+                    and previous[0] + 1 == lineno and previous[1] == prefix
+                    and CJK_RE.search(text) and not CJK_RE.search(previous[3])
+                    and LATIN_WORD_RE.search(previous[3])):
+                yield filepath, previous[0], previous[3], text
+            previous = record
+
+
+def residual_latin(text, keep):
+    """中文行中残留英文单词的字符占比"""
+    latin = 0
+    for token in TOKEN_RE.findall(text):
+        if CODE_LIKE_RE.search(token):
+            continue
+        for word in LATIN_WORD_RE.findall(token):
+            if word.lower() not in keep:
+                latin += len(word)
+    cjk = len(CJK_RE.findall(text))
+    return latin / (latin + cjk) if latin + cjk else 0.0
+
+
+def glossary_adherence(english, chinese, rules):
+    """返回 (适用的术语数, 违反的术语列表)"""
+    applicable = 0
+    violations = []
+    for term, expected, pattern in rules:
+        if pattern.search(english):
+            applicable += 1
+            if expected.lower() not in chinese.lower():
+                violations.append(f"{term}→{expected}")
+    return applicable, violations
+
+
+def score_corpus(code_dir, rules, keep):
+    """对全部注释对计算特征和分数，返回 (注释对列表, 分数数组)"""
+    pairs = []
+    latin = array('d')
+    log_ratio = array('d')
+    adherence = array('d')
+    spaces = array('d')
+
+    for filepath, lineno, english, chinese in bilingual_pairs(code_dir):
+        applicable, violations = glossary_adherence(english, chinese, rules)
+        pairs.append((filepath, lineno, english, chinese, violations))
+        latin.append(residual_latin(chinese, keep))
+        log_ratio.append(math.log(max(len(chinese), 1) / max(len(english), 1)))
+        adherence.append(1 - len(violations) / applicable if applicable else 1.0)
+        spaces.append(1.0 if '  ' in chinese else 0.0)
+
+    n = len(pairs)
+    if not n:
+        return pairs, {}
+
+    mean = sum(log_ratio) / n
+    std = math.sqrt(sum((x - mean) ** 2 for x in log_ratio) / n) or 1.0
+    z = array('d', ((x - mean) / std for x in log_ratio))
+
+    # 分数越高越差：残留英文 + 术语违反 + 长度异常（|z| 超过 2 开始计入）+ 连续空格
+    scores = array('d', (
+        l + (1 - a) + max(abs(zz) - 2, 0) * 0.25 + s * 0.2
+        for l, a, zz, s in zip(latin, adherence, z, spaces)
+    ))
+    return pairs, {"score": scores, "latin": latin, "adherence": adherence, "z": z, "spaces": spaces}
+
+
+def chapter_of(filepath, code_dir):
+    """文件所属的章节目录名"""
+    return Path(filepath).relative_to(code_dir).parts[0]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="为双语注释对的翻译质量打分")
+    parser.add_argument('--limit', type=int, default=30, help="输出最差的注释对数量")
+    parser.add_argument('--json', action='store_true', help="以 JSON 输出")
+    args = parser.parse_args()
+
+    code_dir = Path("chapters-data/code")
+    if not code_dir.exists() or not GUIDELINES.exists():
+        print("Error: chapters-data/code or translation-guidelines.md not found")
+        sys.exit(1)
+
+    rules, keep = load_guidelines(GUIDELINES)
+    pairs, metrics = score_corpus(code_dir, rules, keep)
+    if not pairs:
+        print("No bilingual comment pairs found")
+        return
+
+    scores = metrics["score"]
+    worst = sorted(range(len(pairs)), key=lambda i: -scores[i])[:args.limit]
+
+    chapters = defaultdict(list)
+    for i, (filepath, *_rest) in enumerate(pairs):
+        chapters[chapter_of(filepath, code_dir)].append(i)
+
+    def summarize(indices):
+        count = len(indices)
+        return {
+            "pairs": count,
+            "score": sum(scores[i] for i in indices) / count,
+            "latin": sum(metrics["latin"][i] for i in indices) / count,
+            "adherence": sum(metrics["adherence"][i] for i in indices) / count,
+            "length_outliers": sum(1 for i in indices if abs(metrics["z"][i]) > 2),
+        }
+
+    chapter_summary = {name: summarize(indices) for name, indices in sorted(chapters.items())}
+
+    if args.json:
+        json.dump({
+            "overall": summarize(range(len(pairs))),
+            "chapters": chapter_summary,
+            "worst": [{
+                "file": pairs[i][0].as_posix(), "line": pairs[i][1], "en": pairs[i][2], "zh": pairs[i][3],
+                "score": round(scores[i], 3), "violations": pairs[i][4],
+            } for i in worst],
+        }, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        return
+
+    print("最差的注释对:")
+    for i in worst:
+        filepath, lineno, english, chinese, violations = pairs[i]
+        print(f"{scores[i]:5.2f}  {filepath.as_posix()}:{lineno}")
+        print(f"       EN: {english}")
+        print(f"       ZH: {chinese}")
+        if violations:
+            print(f"       术语: {', '.join(violations)}")
+
+    print(f"\n{'章节':<50} {'对数':>5} {'分数':>6} {'残留英文':>8} {'术语一致':>8}")
+    for name, s in sorted(chapter_summary.items(), key=lambda x: -x[1]["score"]):
+        print(f"{name:<50} {s['pairs']:5} {s['score']:6.2f} {s['latin']:8.1%} {s['adherence']:8.1%}")
+
+    overall = summarize(range(len(pairs)))
+    print(f"\n{'='*70}")
+    print(f"总计: {overall['pairs']} 个注释对, 平均分数 {overall['score']:.3f}")
+    print(f"残留英文: {overall['latin']:.1%}, 术语一致: {overall['adherence']:.1%}, "
+          f"长度异常: {overall['length_outliers']} 个")
+    print(f"{'='*70}")
+
+
+if __name__ == "__main__":
+    main()
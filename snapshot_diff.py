@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+无障碍快照结构比对：解析 `uid=... Role "name"` 缩进树，按子树哈希比对两个快照
+- 每个子树计算 Merkle 哈希（角色、名称、属性、子节点哈希），不含 uid，uid 重新编号不影响结果
+- 相同子树通过哈希直接配对，只深入比较哈希不同的部分
+- --structure-only 只比较角色结构，用于比较中英文页面
+- 两个参数都是目录时，按文件名配对并行比较；--lang-pairs 在同一目录中配对 -en/-zh 快照
+
+用法：
+  python3 snapshot_diff.py snapshot-chapter4-en.json snapshot-final-chapter4.json
+  python3 snapshot_diff.py --structure-only --lang-pairs .
+  python3 snapshot_diff.py old-snapshots/ new-snapshots/
+"""
+
+import argparse
+import hashlib
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from io_pipeline import parse_positive
+
+LINE_RE = re.compile(r'^( *)uid=(\S+) (\S+)(?: "((?:[^"\\]|\\.)*)")?(.*)$')
+ATTR_RE = re.compile(r'([\w-]+)(?:=("(?:[^"\\]|\\.)*"|\S+))?')
+SNAPSHOT_GLOBS = ("snapshot*.json", "*snapshot*.txt")
+
+
+class Node:
+    """快照树节点"""
+
+    __slots__ = ("uid", "role", "name", "attrs", "children", "digest")
+
+    def __init__(self, uid, role, name, attrs):
+        self.uid = uid
+        self.role = role
+        self.name = name
+        self.attrs = attrs
+        self.children = []
+        self.digest = None
+
+    def label(self):
+        """用于输出的简短描述"""
+        text = f'{self.role} "{self.name}"' if self.name else self.role
+        return text if len(text) <= 80 else text[:77] + '...'
+
+
+def parse_snapshot(path):
+    """解析快照文件为树，返回根节点（多个顶层节点时包一层虚拟根）"""
+    roots = []
+    stack = []  # [(缩进, 节点)]
+    with open(path, 'r', encoding='utf-8') as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if not line.strip():
+                continue
+            m = LINE_RE.match(line)
+            if not m:
+                raise ValueError(f"{path}:{lineno}: unrecognized snapshot line")
+            indent, uid, role, name, rest = m.groups()
+            attrs = tuple(sorted((k, v or '') for k, v in ATTR_RE.findall(rest)))
+            node = Node(uid, role, name or '', attrs)
+
+            depth = len(indent)
+            while stack and stack[-1][0] >= depth:
+                stack.pop()
+            (stack[-1][1].children if stack else roots).append(node)
+            stack.append((depth, node))
+
+    if len(roots) == 1:
+        return roots[0]
+    root = Node('', '(document)', '', ())
+    root.children = roots
+    return root
+
+
+def compute_digests(node, structure_only):
+    """自底向上计算每个子树的哈希（迭代实现，避免深树递归）"""
+    order = []
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        order.append(current)
+        pending.extend(current.children)
+
+    for current in reversed(order):
+        h = hashlib.blake2b(digest_size=16)
+        h.update(current.role.encode('utf-8'))
+        if not structure_only:
+            h.update(b'\0' + current.name.encode('utf-8'))
+            for key, value in current.attrs:
+                h.update(b'\0' + key.encode('utf-8') + b'=' + value.encode('utf-8'))
+        for child in current.children:
+            h.update(b'\1' + child.digest)
+        current.digest = h.digest()
+
+
+def match_children(old, new):
+    """配对两组子节点：先按哈希配对相同子树，再按角色顺序配对其余节点
+
+    返回 (配对列表[(旧, 新)], 删除的旧节点, 新增的新节点)；相同子树的配对不再深入。
+    """
+    by_digest = {}
+    for j, child in enumerate(new):
+        by_digest.setdefault(child.digest, deque()).append(j)
+
+    used_new = set()
+    unmatched_old = []
+    for child in old:
+        candidates = by_digest.get(child.digest)
+        if candidates:
+            used_new.add(candidates.popleft())
+        else:
+            unmatched_old.append(child)
+
+    remaining_new = [child for j, child in enumerate(new) if j not in used_new]
+
+    by_role = {}
+    for child in remaining_new:
+        by_role.setdefault(child.role, deque()).append(child)
+
+    pairs = []
+    removed = []
+    for child in unmatched_old:
+        candidates = by_role.get(child.role)
+        if candidates:
+            pairs.append((child, candidates.popleft()))
+        else:
+            removed.append(child)
+
+    paired_new = {id(b) for _, b in pairs}
+    added = [child for child in remaining_new if id(child) not in paired_new]
+    return pairs, removed, added
+
+
+def diff_trees(old, new, structure_only):
+    """比较两棵已计算哈希的树，返回差异行列表"""
+    changes = []
+    pending = [(old, new, old.role)]
+    while pending:
+        a, b, path = pending.pop()
+        if a.digest == b.digest:
+            continue
+        if not structure_only and a.name != b.name:
+            changes.append(f"~ {path}: {a.label()} → {b.label()}")
+        if not structure_only and a.attrs != b.attrs:
+            before = ' '.join(f"{k}={v}" for k, v in sorted(set(a.attrs) - set(b.attrs)))
+            after = ' '.join(f"{k}={v}" for k, v in sorted(set(b.attrs) - set(a.attrs)))
+            changes.append(f"~ {path}: {a.label()} [{before}] → [{after}]")
+
+        pairs, removed, added = match_children(a.children, b.children)
+        for child in removed:
+            changes.append(f"- {path}/{child.role}: {child.label()} ({count_nodes(child)} nodes)")
+        for child in added:
+            changes.append(f"+ {path}/{child.role}: {child.label()} ({count_nodes(child)} nodes)")
+        for child_a, child_b in reversed(pairs):
+            pending.append((child_a, child_b, f"{path}/{child_a.role}"))
+    return changes
+
+
+def count_nodes(node):
+    """子树节点数"""
+    total = 0
+    pending = [node]
+    while pending:
+        current = pending.pop()
+        total += 1
+        pending.extend(current.children)
+    return total
+
+
+def diff_files(old_path, new_path, structure_only=False):
+    """比较两个快照文件，返回 (旧路径, 新路径, 差异行列表)"""
+    old = parse_snapshot(old_path)
+    new = parse_snapshot(new_path)
+    compute_digests(old, structure_only)
+    compute_digests(new, structure_only)
+    return str(old_path), str(new_path), diff_trees(old, new, structure_only)
+
+
+def snapshot_files(directory):
+    """列出目录中的快照文件"""
+    return sorted({p for pattern in SNAPSHOT_GLOBS for p in directory.glob(pattern)})
+
+
+def pair_directories(old_dir, new_dir):
+    """按文件名配对两个目录中的快照"""
+    new_names = {p.name: p for p in snapshot_files(new_dir)}
+    return [(p, new_names[p.name]) for p in snapshot_files(old_dir) if p.name in new_names]
+
+
+def pair_languages(directory):
+    """在同一目录中配对 -en / -zh 快照"""
+    files = {p.name: p for p in snapshot_files(directory)}
+    return [(p, files[name.replace('-en', '-zh')]) for name, p in files.items()
+            if '-en' in name and name.replace('-en', '-zh') in files]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="按子树哈希比较无障碍快照，忽略 uid 重新编号")
+    parser.add_argument('paths', nargs='*', type=Path, help="两个快照文件，或两个快照目录")
+    parser.add_argument('--lang-pairs', type=Path, metavar='DIR', help="比较目录中所有 -en/-zh 快照对")
+    parser.add_argument('--structure-only', action='store_true', help="只比较角色结构，忽略名称和属性")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    args = parser.parse_args()
+
+    if args.lang_pairs:
+        pairs = pair_languages(args.lang_pairs)
+    elif len(args.paths) == 2 and all(p.is_dir() for p in args.paths):
+        pairs = pair_directories(*args.paths)
+    elif len(args.paths) == 2:
+        pairs = [tuple(args.paths)]
+    else:
+        parser.error("expected two snapshot files, two directories, or --lang-pairs DIR")
+
+    if not pairs:
+        print("Error: no snapshot pairs found")
+        sys.exit(1)
+
+    try:
+        if len(pairs) == 1:
+            results = [diff_files(*pairs[0], args.structure_only)]
+        else:
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                results = list(pool.map(diff_files, *zip(*pairs), [args.structure_only] * len(pairs)))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    differing = 0
+    for old_path, new_path, changes in results:
+        if not changes:
+            continue
+        differing += 1
+        print(f"--- {old_path}\n+++ {new_path}")
+        for change in changes:
+            print(change)
+        print()
+
+    print(f"{'='*70}")
+    print(f"总计: {len(results)} 对快照")
+    print(f"存在差异: {differing} 对")
+    print(f"{'='*70}")
+
+    sys.exit(1 if differing else 0)
+
+
+if __name__ == "__main__":
+    main()
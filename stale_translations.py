@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+过期译文检测：找出英文在其译文之后被修改过的注释对和段落
+- 示例代码：英文注释行与紧随其下的中文注释行（process_file 插入的译文）构成一对
+- 章节正文：pages/ 与 pages-zh/ 中同名 XML 按 simpara / title 的顺序一一配对
+- 只调用一次 git log（首父链、从旧到新、-U0 补丁）覆盖整棵树，流式解析并重放每个补丁，
+  得到每个文件每一行最后被修改的提交，相当于一次性完成所有文件的 blame；
+  工作区和暂存区的改动再用一次 git diff HEAD 叠加，适合在提交前运行
+- 英文一侧最后修改的提交晚于中文一侧时判为过期
+
+用法：
+  python3 stale_translations.py [--json] [--no-pages] [--no-code]
+"""
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+from byte_patch import iter_lines
+
+CODE_DIR = Path("chapters-data/code")
+EN_DIR = Path("pages")
+ZH_DIR = Path("pages-zh")
+PATHSPECS = [f"{CODE_DIR.as_posix()}/*.zig", f"{EN_DIR.as_posix()}/*.xml", f"{ZH_DIR.as_posix()}/*.xml"]
+
+HUNK_RE = re.compile(rb'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+CJK_RE = re.compile(r'[一-鿿]')
+LATIN_RE = re.compile(r'[A-Za-z]{2,}')
+BLOCK_RE = re.compile(r'<(simpara|title)\b[^>]*>(.*?)</\1>', re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+
+WORKTREE = "worktree"
+
+
+def git_stream(args):
+    """启动 git 子进程，逐行产出标准输出（字节）"""
+    proc = subprocess.Popen(["git", "-c", "core.quotePath=false", *args], stdout=subprocess.PIPE)
+    try:
+        yield from proc.stdout
+    finally:
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"git {args[0]} failed with exit code {proc.returncode}")
+
+
+def replay(stream, ages, commits, label=None):
+    """流式解析 git log / git diff 的 -U0 补丁，把每个补丁重放到 ages {路径: [每行的提交序号]}
+
+    git log 的输出以 "commit <哈希> <时间戳>" 分隔提交；label 不为 None 时（git diff）
+    整个输出视为一个名为 label 的提交。
+    """
+    current = None
+    path = None
+    lines = None
+    shift = 0
+    in_header = False
+    if label is not None:
+        commits.append((label, None))
+        current = len(commits) - 1
+
+    for raw in stream:
+        if raw.startswith(b'commit ') and label is None:
+            _, sha, timestamp = raw.split()
+            commits.append((sha.decode(), int(timestamp)))
+            current = len(commits) - 1
+        elif raw.startswith(b'diff --git '):
+            path, lines, shift, in_header = None, None, 0, True
+        elif in_header and raw.startswith(b'--- '):
+            name = raw[4:].rstrip(b'\n').decode('utf-8', errors='replace')
+            if name != '/dev/null':
+                path = name[2:]
+        elif in_header and raw.startswith(b'+++ '):
+            name = raw[4:].rstrip(b'\n').decode('utf-8', errors='replace')
+            if name == '/dev/null':
+                ages.pop(path, None)
+                path = None
+            else:
+                if path != name[2:]:
+                    ages[name[2:]] = []
+                path = name[2:]
+                lines = ages.setdefault(path, [])
+        elif raw.startswith(b'@@') and lines is not None:
+            in_header = False
+            m = HUNK_RE.match(raw)
+            old_start = int(m.group(1))
+            old_count = 1 if m.group(2) is None else int(m.group(2))
+            new_count = 1 if m.group(4) is None else int(m.group(4))
+            start = (old_start - 1 if old_count else old_start) + shift
+            lines[start:start + old_count] = [current] * new_count
+            shift += new_count - old_count
+
+
+def line_ages(pathspecs):
+    """一次 git log + 一次 git diff HEAD，返回 ({路径: [每行的提交序号]}, [(哈希, 时间戳)])"""
+    ages = {}
+    commits = []
+    replay(git_stream(["log", "--first-parent", "--diff-merges=first-parent", "--reverse", "--no-renames",
+                       "-p", "-U0", "--format=commit %H %ct", "--", *pathspecs]), ages, commits)
+    replay(git_stream(["diff", "--no-renames", "-U0", "HEAD", "--", *pathspecs]), ages, commits, WORKTREE)
+    return ages, commits
+
+
+def read_lines(path):
+    """按 git 的规则（只以 \\n 分行）读取文件各行的文本"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return [line.decode('utf-8', errors='replace') for _, line, _ in iter_lines(data)]
+
+
+def file_ages(path, ages, commits, warnings):
+    """某个文件每行的提交序号；未被跟踪的文件视为全部在工作区修改；行数对不上时返回 None"""
+    lines = read_lines(path)
+    key = path.as_posix()
+    if key not in ages:
+        return lines, [len(commits) - 1] * len(lines)
+    if len(ages[key]) != len(lines):
+        warnings.append(f"{key}: 重放得到 {len(ages[key])} 行，文件有 {len(lines)} 行，已跳过")
+        return lines, None
+    return lines, ages[key]
+
+
+def stale_comments(ages, commits, warnings):
+    """产出示例代码中过期的 (文件, 英文行号, 英文, 中文, 英文提交, 中文提交)"""
+    for path in sorted(CODE_DIR.rglob("*.zig")):
+        lines, line_age = file_ages(path, ages, commits, warnings)
+        if line_age is None:
+            continue
+        for i in range(len(lines) - 1):
+            en, zh = lines[i].strip(), lines[i + 1].strip()
+            if not (en.startswith('//') and zh.startswith('//')):
+                continue
+            if CJK_RE.search(en) or not CJK_RE.search(zh) or not LATIN_RE.search(en):
+                continue
+            if lines[i].split('//', 1)[0] != lines[i + 1].split('//', 1)[0]:
+                continue
+            if line_age[i] > line_age[i + 1]:
+                yield path, i + 1, en, zh, line_age[i], line_age[i + 1]
+
+
+def blocks(text):
+    """产出 XML 中 simpara / title 的 (标签, 起始行号, 结束行号, 纯文本)"""
+    for m in BLOCK_RE.finditer(text):
+        first = text.count('\n', 0, m.start()) + 1
+        last = first + m.group(0).count('\n')
+        yield m.group(1), first, last, ' '.join(TAG_RE.sub('', m.group(2)).split())
+
+
+def stale_paragraphs(ages, commits, warnings):
+    """产出章节正文中过期的 (英文文件, 英文行号, 英文, 中文, 英文提交, 中文提交)"""
+    for en_path in sorted(EN_DIR.glob("*.xml")):
+        zh_path = ZH_DIR / en_path.name
+        if not zh_path.exists():
+            continue
+        en_lines, en_age = file_ages(en_path, ages, commits, warnings)
+        zh_lines, zh_age = file_ages(zh_path, ages, commits, warnings)
+        if en_age is None or zh_age is None:
+            continue
+        en_blocks = list(blocks('\n'.join(en_lines)))
+        zh_blocks = list(blocks('\n'.join(zh_lines)))
+        if [b[0] for b in en_blocks] != [b[0] for b in zh_blocks]:
+            warnings.append(f"{en_path.as_posix()}: 与 {zh_path.as_posix()} 的段落结构不一致，已跳过")
+            continue
+        for (_, en_first, en_last, en_text), (_, zh_first, zh_last, zh_text) in zip(en_blocks, zh_blocks):
+            en_commit = max(en_age[en_first - 1:en_last])
+            zh_commit = max(zh_age[zh_first - 1:zh_last])
+            if en_commit > zh_commit:
+                yield en_path, en_first, en_text, zh_text, en_commit, zh_commit
+
+
+def describe(commits, index):
+    """提交序号的可读形式"""
+    sha, _ = commits[index]
+    return sha if sha == WORKTREE else sha[:10]
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="找出英文在译文之后被修改过的注释对和段落")
+    parser.add_argument('--json', action='store_true', help="以 JSON 输出")
+    parser.add_argument('--no-code', action='store_true', help="不检查示例代码注释")
+    parser.add_argument('--no-pages', action='store_true', help="不检查 pages/ 与 pages-zh/ 段落")
+    args = parser.parse_args()
+
+    if not CODE_DIR.exists():
+        print("Error: chapters-data/code directory not found")
+        sys.exit(1)
+
+    try:
+        ages, commits = line_ages(PATHSPECS)
+    except (OSError, RuntimeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    warnings = []
+    stale = []
+    if not args.no_code:
+        stale.extend(("code", *s) for s in stale_comments(ages, commits, warnings))
+    if not args.no_pages:
+        stale.extend(("pages", *s) for s in stale_paragraphs(ages, commits, warnings))
+
+    if args.json:
+        json.dump([{
+            "type": kind, "file": path.as_posix(), "line": lineno, "en": en, "zh": zh,
+            "en_commit": describe(commits, en_commit), "zh_commit": describe(commits, zh_commit),
+        } for kind, path, lineno, en, zh, en_commit, zh_commit in stale], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+        sys.exit(1 if stale else 0)
+
+    for warning in warnings:
+        print(f"Warning: {warning}")
+    for kind, path, lineno, en, zh, en_commit, zh_commit in stale:
+        print(f"{path.as_posix()}:{lineno}: 英文修改于 {describe(commits, en_commit)}，"
+              f"译文停留在 {describe(commits, zh_commit)}")
+        print(f"    EN: {en[:120]}")
+        print(f"    ZH: {zh[:120]}")
+
+    print(f"\n{'='*70}")
+    print(f"已重放: {len(commits) - 1} 个提交, {len(ages)} 个文件")
+    print(f"过期译文: {sum(1 for s in stale if s[0] == 'code')} 个注释对, "
+          f"{sum(1 for s in stale if s[0] == 'pages')} 个段落")
+    print(f"{'='*70}")
+    sys.exit(1 if stale else 0)
+
+
+if __name__ == "__main__":
+    main()
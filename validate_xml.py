@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+章节 XML 校验：在构建网站前检查 pages/、pages-zh/、pageszhkb/ 中所有章节 XML
+- 用 expat 流式解析检查格式良好性，出错时报告行号和列号
+- 结构检查：根元素下的 info/title 非空；chapter 必须有 xml:id 且文件内所有 xml:id 唯一；
+  programlisting 只能包含文本，未解析的 include 指令必须独占整个清单
+- 骨架比对：提取块级元素序列（chapter、section、simpara、programlisting 等），逐一比较英文与各中文版本
+- 进程池并行解析，一次运行报告全部错误，有错误时退出码为 1，可作为构建前的检查
+
+用法：
+  python3 validate_xml.py [--all] [--jobs N] [--max-diffs N]
+"""
+
+import argparse
+import difflib
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.parsers import expat
+
+from io_pipeline import parse_positive
+
+EN_DIR = "pages"
+ZH_DIRS = ["pages-zh", "pageszhkb"]
+
+DB = "http://docbook.org/ns/docbook"
+XML_NS = "http://www.w3.org/XML/1998/namespace"
+ROOTS = {"book", "article"}
+# 参与骨架比对的块级元素；行内元素（literal、emphasis、link 等）在翻译中数量会变化，不参与比对
+SKELETON = {
+    "chapter", "section", "title", "simpara", "para", "formalpara", "programlisting", "screen",
+    "literallayout", "itemizedlist", "orderedlist", "listitem", "informaltable", "table", "row",
+    "note", "tip", "important", "warning", "caution",
+}
+UNRESOLVED_RE = re.compile(r'^Unresolved directive in \S+ - include::\S+\[[^\]]*\]$')
+
+
+def local_name(name):
+    """去掉 expat 命名空间前缀，返回 (命名空间, 本地名)"""
+    ns, _, local = name.rpartition(' ')
+    return ns, local
+
+
+def validate_file(path):
+    """解析并检查单个文件，返回 (路径, [错误], [(行号, 深度, 元素名, xml:id)])"""
+    errors = []
+    skeleton = []
+    ids = {}
+    stack = []
+    info_title = []
+    listing = None  # [起始行号, 文本片段, 是否含子元素]
+
+    parser = expat.ParserCreate(namespace_separator=' ')
+
+    def start(name, attrs):
+        nonlocal listing
+        ns, tag = local_name(name)
+        line = parser.CurrentLineNumber
+        depth = len(stack)
+        xml_id = attrs.get(f"{XML_NS} id")
+
+        if depth == 0 and (ns != DB or tag not in ROOTS):
+            errors.append(f"{path}:{line}: 根元素应为 DocBook book/article，实际为 <{tag}>")
+        if xml_id is not None:
+            if xml_id in ids:
+                errors.append(f"{path}:{line}: 重复的 xml:id \"{xml_id}\"（首次出现在第 {ids[xml_id]} 行）")
+            else:
+                ids[xml_id] = line
+        if tag == "chapter" and not xml_id:
+            errors.append(f"{path}:{line}: <chapter> 缺少 xml:id")
+        if listing is not None:
+            listing[2] = True
+        if tag == "programlisting":
+            listing = [line, [], False]
+        if tag in SKELETON:
+            skeleton.append((line, depth, tag, xml_id))
+        stack.append(tag)
+
+    def end(name):
+        nonlocal listing
+        tag = stack.pop()
+        if tag == "programlisting" and listing is not None:
+            line, parts, nested = listing
+            text = ''.join(parts)
+            if nested:
+                errors.append(f"{path}:{line}: <programlisting> 中含有子元素，渲染时内容会丢失")
+            elif "Unresolved directive" in text and not UNRESOLVED_RE.match(text.strip()):
+                errors.append(f"{path}:{line}: <programlisting> 中 include 指令前后有多余文本")
+            elif not text.strip():
+                errors.append(f"{path}:{line}: 空的 <programlisting>")
+            listing = None
+
+    def chars(data):
+        if listing is not None and stack and stack[-1] == "programlisting":
+            listing[1].append(data)
+        if stack[-2:] == ["info", "title"] and len(stack) == 3:
+            info_title.append(data)
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = chars
+
+    try:
+        with open(path, 'rb') as f:
+            parser.ParseFile(f)
+    except expat.ExpatError as e:
+        errors.append(f"{path}:{e.lineno}:{e.offset + 1}: XML 格式错误: {expat.ErrorString(e.code)}")
+        return path, errors, None
+
+    if not ''.join(info_title).strip():
+        errors.append(f"{path}:1: 缺少 info/title 或标题为空")
+    return path, errors, skeleton
+
+
+def compare_skeletons(en_path, en, zh_path, zh, max_diffs):
+    """比较两个骨架，返回错误列表；每对文件最多报告 max_diffs 处差异"""
+    key = lambda item: (item[1], item[2], item[3])
+    matcher = difflib.SequenceMatcher(None, [key(i) for i in en], [key(i) for i in zh], autojunk=False)
+    errors = []
+    for op, i1, i2, j1, j2 in matcher.get_opcodes():
+        if op == 'equal':
+            continue
+        if len(errors) == max_diffs:
+            errors.append(f"{zh_path}: 与 {en_path} 还有更多骨架差异未列出")
+            break
+        en_line = en[i1][0] if i1 < len(en) else (en[-1][0] if en else 1)
+        zh_line = zh[j1][0] if j1 < len(zh) else (zh[-1][0] if zh else 1)
+        expected = ' '.join(f"<{t}>" for _, _, t, _ in en[i1:i2][:4]) or "（无）"
+        actual = ' '.join(f"<{t}>" for _, _, t, _ in zh[j1:j2][:4]) or "（无）"
+        errors.append(f"{zh_path}:{zh_line}: 骨架与 {en_path}:{en_line} 不一致: 期望 {expected}，实际 {actual}")
+    return errors
+
+
+def main():
+    """主函数"""
+    parser = argparse.ArgumentParser(description="校验章节 XML 的格式与 DocBook 结构")
+    parser.add_argument('--all', action='store_true', help="同时检查非章节文件（如 index.xml）")
+    parser.add_argument('--jobs', type=parse_positive, default=None, help="并行进程数（默认 CPU 数）")
+    parser.add_argument('--max-diffs', type=int, default=5, help="每对文件最多报告的骨架差异数")
+    args = parser.parse_args()
+
+    pattern = "*.xml" if args.all else "[0-9]*.xml"
+    dirs = [EN_DIR] + ZH_DIRS
+    files = [p.as_posix() for d in dirs for p in sorted(Path(d).glob(pattern))]
+    if not files:
+        print("Error: no chapter XML found under pages/, pages-zh/ or pageszhkb/")
+        sys.exit(1)
+
+    errors = []
+    skeletons = {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        for path, file_errors, skeleton in pool.map(validate_file, files, chunksize=8):
+            errors.extend(file_errors)
+            skeletons[path] = skeleton
+
+    compared = 0
+    for en_path in (f for f in files if f.startswith(f"{EN_DIR}/")):
+        name = Path(en_path).name
+        for zh_dir in ZH_DIRS:
+            zh_path = f"{zh_dir}/{name}"
+            if zh_path not in skeletons:
+                errors.append(f"{zh_path}: 缺少与 {en_path} 对应的译文文件")
+                continue
+            if skeletons[en_path] is None or skeletons[zh_path] is None:
+                continue
+            compared += 1
+            errors.extend(compare_skeletons(en_path, skeletons[en_path], zh_path, skeletons[zh_path],
+                                            args.max_diffs))
+
+    for error in errors:
+        print(error)
+
+    print(f"\n{'='*70}")
+    print(f"总计: {len(files)} 个文件, 比对 {compared} 对骨架")
+    print(f"错误: {len(errors)} 个")
+    print(f"{'='*70}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()